@@ -16,22 +16,462 @@ El scraper maneja automáticamente:
 Requisitos:
 -----------
 - requests: Para realizar peticiones HTTP
+- aiohttp: Para paginar resultados con peticiones concurrentes
+- orjson: Para (de)serializar JSON más rápido que el módulo estándar
 - playwright: Para automatizar el navegador y manejar login
 - pandas: Para manipulación de datos (opcional)
 
 Fecha: 2025
 """
 
+import asyncio
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+import gzip
+import hashlib
+import logging
 import time
-import csv
 import pandas as pd
-from typing import List, Dict, Optional
-from playwright.sync_api import sync_playwright
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple
+import aiohttp
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 from typing import Any
 import os
 import random
+import re
+import sqlite3
+import threading
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
+
+
+# Progreso y errores por batch del pipeline asíncrono (una línea por evento,
+# sin emojis); los mensajes de inicio/fin de cada scraping siguen en stdout
+logger = logging.getLogger(__name__)
+
+# Etiquetas de resaltado que la API inserta en título y abstract
+_MARK_RE = re.compile(r"</?mark>")
+
+# Caracteres que obligan a entrecomillar un campo CSV (los saltos de línea ya
+# se reemplazan por espacios antes de escribir)
+_CSV_NEEDS_QUOTE = re.compile(r'[",]').search
+
+# Tabla para aplanar saltos de línea en una sola pasada (str.translate)
+_CSV_NEWLINES = str.maketrans({'\n': ' ', '\r': ' '})
+
+# Escritura de CSV por bloques: buffer de 1 MiB y filas unidas en un solo
+# write() cada _CSV_FLUSH_ROWS artículos
+_CSV_BUFFER_SIZE = 1 << 20
+_CSV_FLUSH_ROWS = 1000
+
+# Columnas de cada artículo, en el orden en que las genera extract_articles()
+_ARTICLE_COLS = (
+    "id", "title", "abstract", "authors", "publication_date", "journal", "doi",
+    "subjects", "page_start", "page_end", "volume", "issue", "publisher",
+    "pdf_links", "database", "peer_reviewed", "language", "document_type",
+    "isbn", "issn",
+)
+
+# pyarrow es opcional: si está disponible, las columnas de texto usan
+# strings de Arrow (menos memoria y operaciones .str más rápidas) y los CSV
+# grandes se escriben con su writer nativo
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pa_compute
+    import pyarrow.csv as pa_csv
+    _STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    pa = None
+    _STRING_DTYPE = "string"
+
+# A partir de este número de artículos save_to_csv() usa pyarrow.csv
+_ARROW_CSV_MIN_ROWS = 50_000
+
+# mgzip es opcional: comprime GZIP en paralelo en save_to_csv(compress=True);
+# sin él se usa el módulo gzip estándar
+try:
+    import mgzip
+except ImportError:
+    mgzip = None
+
+# Tamaño de bloque que cada hilo de mgzip comprime por separado (4 MiB).
+# mgzip reparte un bloque por hilo, así que un archivo solo se comprime en
+# paralelo si ocupa varios bloques: con bloques de 200 MB cualquier CSV
+# menor se comprimía en un único hilo. Unos pocos MiB mantienen ocupados
+# todos los núcleos sin que la cabecera extra de cada miembro gzip pese.
+_GZIP_BLOCK_SIZE = 1 << 22
+
+# brotli es opcional: requests/urllib3 y aiohttp descomprimen "br" de forma
+# transparente cuando está instalado. Solo se anuncia si se puede decodificar.
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+# Selectores de los formularios de login, unidos en un solo selector CSS por
+# elemento para que Playwright los evalúe en una única consulta
+# Botón de login con Google (SSO institucional)
+_GOOGLE_LOCATOR = ", ".join([
+    'button:has-text("Google")',
+    'a:has-text("Google")',
+    'button:has-text("Gmail")',
+    'a:has-text("Gmail")',
+    '[data-provider="google"]',
+    '.google-login',
+    '#google-login',
+    'button[title*="Google"]',
+    'a[href*="google"]',
+    'button[class*="google"]',
+    'a[class*="google"]',
+    'button:has([class*="google"])',
+    'a:has([class*="google"])',
+    'div[role="button"]:has-text("Google")',
+])
+
+# Campo de email de Google
+_EMAIL_LOCATOR = ", ".join([
+    'input[type="email"]',
+    'input[name="identifier"]',
+    'input[id="identifierId"]',
+    '#Email',
+    'input[aria-label*="email"]',
+    'input[aria-label*="correo"]',
+])
+
+# Botón "Siguiente" tras el email
+_NEXT_LOCATOR = ", ".join([
+    'button:has-text("Next")',
+    'button:has-text("Siguiente")',
+    'input[type="submit"]',
+    '#identifierNext',
+    'button[id*="next"]',
+    'button[class*="next"]',
+])
+
+# Campo de contraseña
+_PASSWORD_LOCATOR = ", ".join([
+    'input[type="password"]',
+    'input[name="password"]',
+    'input[aria-label*="password"]',
+    'input[aria-label*="contraseña"]',
+    '#password',
+    'input[name="Passwd"]',
+])
+
+# Botón para enviar la contraseña
+_LOGIN_LOCATOR = ", ".join([
+    'button:has-text("Next")',
+    'button:has-text("Siguiente")',
+    'button:has-text("Sign in")',
+    'button:has-text("Iniciar sesión")',
+    'input[type="submit"]',
+    '#passwordNext',
+    'button[id*="next"]',
+])
+
+# Estado completo del navegador (cookies + localStorage) entre ejecuciones
+_STORAGE_STATE_PATH = os.path.join("data", "cookies", "ebsco_storage.json")
+
+# A partir de este número de resultados, la extracción de artículos se hace
+# en un ProcessPoolExecutor para no competir con el event loop
+_PROCESS_POOL_MIN_RESULTS = 10_000
+
+# Segundos durante los que una validación de cookies se considera vigente
+_COOKIES_FRESH_SECONDS = 300
+
+# Vigencia por defecto de una página en la caché de search() (cache_ttl)
+_CACHE_TTL_SECONDS = 24 * 3600
+
+# Argumentos anti-detección del Chromium compartido por todos los logins
+_CHROMIUM_ARGS = [
+    '--disable-blink-features=AutomationControlled',  # Oculta que es automatizado
+    '--disable-dev-shm-usage',  # Mejora rendimiento en Linux
+    '--no-sandbox',  # Necesario en algunos entornos
+    '--disable-extensions',  # Desactiva extensiones
+    '--disable-plugins-discovery',
+    '--disable-web-security',  # Solo para testing
+    '--disable-features=VizDisplayCompositor'
+]
+
+
+def _csv_field(value) -> str:
+    """
+    Convierte un valor en un campo CSV: string sin saltos de línea y
+    entrecomillado solo si contiene comas o comillas (como QUOTE_MINIMAL).
+    """
+    value = str(value).translate(_CSV_NEWLINES)
+    if _CSV_NEEDS_QUOTE(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+@lru_cache(maxsize=8)
+def _row_formatter(columns: Tuple[str, ...]) -> Callable[[Dict], str]:
+    """
+    Genera (y cachea) una función que formatea un artículo como línea CSV.
+    
+    Con el esquema fijo, el cuerpo se compila una vez con una expresión por
+    columna: sin bucle sobre columnas ni llamada a _csv_field() por valor.
+    El resultado es idéntico a unir _csv_field(article.get(col, "")).
+    
+    Args:
+        columns (Tuple[str, ...]): Columnas en el orden de salida.
+    
+    Returns:
+        Callable[[Dict], str]: fmt(article) -> línea CSV terminada en CRLF.
+    """
+    fields = [
+        f"""(('"' + v.replace('"', '""') + '"') """
+        f"if _q(v := _s(_g({col!r}, '')).translate(_t)) else v)"
+        for col in columns
+    ]
+    body = " + ',' + ".join(fields) or "''"
+    src = (
+        "def _fmt(article, _s=str, _t=_CSV_NEWLINES, _q=_CSV_NEEDS_QUOTE):\n"
+        "    _g = article.get\n"
+        f"    return {body} + '\\r\\n'\n"
+    )
+    namespace = {"_CSV_NEWLINES": _CSV_NEWLINES, "_CSV_NEEDS_QUOTE": _CSV_NEEDS_QUOTE}
+    exec(src, namespace)
+    return namespace["_fmt"]
+
+
+def _write_all(fd: int, data: bytearray):
+    """os.write() puede escribir menos bytes de los pedidos: repetir hasta el final."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _write_csv_shard(articles: List[Dict], path: str, columns: List[str]) -> int:
+    """
+    Escribe un fragmento de artículos como CSV independiente (con cabecera).
+    
+    Función de módulo para poder ejecutarse en un ProcessPoolExecutor desde
+    save_to_csv_sharded(); mismo formato que save_to_csv().
+    
+    Returns:
+        int: Número de filas escritas.
+    """
+    fmt = _row_formatter(tuple(columns))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        _write_all(fd, (",".join(columns) + "\r\n").encode("utf-8"))
+        for start in range(0, len(articles), _CSV_FLUSH_ROWS):
+            block = "".join(map(fmt, articles[start:start + _CSV_FLUSH_ROWS]))
+            _write_all(fd, block.encode("utf-8"))
+    finally:
+        os.close(fd)
+    return len(articles)
+
+
+def _dedupe_articles(articles: Iterable[Dict], seen: set) -> List[Dict]:
+    """
+    Filtra artículos ya vistos en páginas anteriores (la API puede repetir
+    registros entre offsets). La clave es id, o doi si no hay id; los
+    artículos sin ninguna de las dos se conservan siempre.
+    
+    Args:
+        articles (Iterable[Dict]): Artículos de una página.
+        seen (set): Claves ya emitidas; se actualiza en el sitio.
+    
+    Returns:
+        List[Dict]: Artículos nuevos, en el mismo orden.
+    """
+    unique = []
+    for article in articles:
+        key = article.get("id") or article.get("doi")
+        if key:
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append(article)
+    return unique
+
+
+def _iter_item_articles(items: List[Dict]) -> Iterator[Dict]:
+    """
+    Transforma los items crudos de la API en diccionarios de artículo.
+    
+    Función de módulo (sin estado de la instancia) usada por
+    EBSCOScraper.iter_articles() y, por ser picklable, también por el
+    ProcessPoolExecutor de los scrapings grandes.
+    
+    Args:
+        items (List[Dict]): Lista data["search"]["items"] de una respuesta.
+    
+    Yields:
+        Dict: Metadatos de un artículo (ver EBSCOScraper.extract_articles()).
+    """
+    for item in items:
+        # Extraer título y abstract quitando las etiquetas <mark> en una pasada
+        title = _MARK_RE.sub("", item.get("title", {}).get("value", ""))
+        abstract = _MARK_RE.sub("", item.get("abstract", {}).get("value", ""))
+
+        # Extraer enlaces a PDF
+        links = item.get("links") or {}
+        pdf_links = [
+            link.get("url")
+            for link in links.get("fullTextLinks", ())
+            if link.get("type") == "pdfFullText"
+        ]
+
+        # Procesar lista de autores
+        authors = [c["name"] for c in item.get("contributors", ()) if c.get("name")]
+
+        # Procesar lista de temas/keywords
+        subjects = [
+            name
+            for name in (subj.get("name", {}).get("value", "") for subj in item.get("subjects", ()))
+            if name
+        ]
+
+        # Construir diccionario con todos los metadatos
+        article = {
+            "id": item.get("id", ""),
+            "title": title,
+            "abstract": abstract,
+            "authors": "; ".join(authors),  # Unir lista con punto y coma
+            "publication_date": item.get("publicationDate", ""),
+            "journal": item.get("source", ""),
+            "doi": item.get("doi", ""),
+            "subjects": "; ".join(subjects),
+            "page_start": item.get("pageStart", ""),
+            "page_end": item.get("pageEnd", ""),
+            "volume": item.get("volume", ""),
+            "issue": item.get("issue", ""),
+            "publisher": item.get("publisherName", ""),
+            "pdf_links": "; ".join(pdf_links),
+            "database": item.get("longDBName", ""),
+            "peer_reviewed": item.get("peerReviewed", False),
+            "language": item.get("language", ""),
+            "document_type": item.get("documentType", ""),
+            "isbn": item.get("isbn", ""),
+            "issn": item.get("issn", ""),
+        }
+        yield article
+
+
+def _extract_articles_pure(items: List[Dict]) -> List[Dict]:
+    """Versión en lista de _iter_item_articles() para ejecutarse en otro proceso."""
+    return list(_iter_item_articles(items))
+
+
+class RateLimiter:
+    """
+    Token bucket compartido por las peticiones síncronas y asíncronas.
+    
+    Repone `rate` tokens por segundo hasta un máximo de `burst`. Cada
+    petición consume uno; si no hay, espera lo necesario para que se
+    reponga. El ritmo se recalibra con las cabeceras de rate limit de cada
+    respuesta, de modo que el scraping va al límite real del servidor en
+    lugar de a una espera fija conservadora.
+    
+    Attributes:
+        rate (float): Tokens (peticiones) por segundo actuales.
+        max_rate (float): Ritmo máximo configurado; update() nunca lo supera.
+        burst (int): Tamaño máximo del bucket.
+    
+    Note:
+        reserve() no contiene ningún await, así que en asyncio la reserva es
+        atómica sin necesidad de un Lock.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.max_rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.ts = time.monotonic()
+        # Instante (monotonic) hasta el que el servidor pidió no enviar nada
+        self._paused_until = 0.0
+
+    def reserve(self) -> float:
+        """
+        Consume un token y retorna cuántos segundos hay que esperar.
+        
+        Los tokens pueden quedar en negativo: cada llamada reserva su turno
+        y las siguientes esperan proporcionalmente más.
+        
+        Returns:
+            float: Segundos a esperar antes de enviar la petición (0 si hay token).
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.ts) * self.rate)
+        self.ts = now
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self._paused_until - now)
+
+    async def acquire(self):
+        """Espera (sin bloquear el event loop) hasta disponer de un token."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self):
+        """Versión bloqueante de acquire() para el cliente requests."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def update(self, headers) -> float:
+        """
+        Ajusta el limitador según las cabeceras de rate limit de la respuesta.
+        
+        - Retry-After, o X-RateLimit-Remaining en 0: pausa todas las
+          peticiones hasta que el servidor vuelva a aceptar tráfico.
+        - X-RateLimit-Remaining y X-RateLimit-Reset: recalibra el ritmo para
+          repartir las peticiones restantes hasta el reset (sin superar
+          max_rate).
+        
+        Args:
+            headers: Cabeceras de la respuesta (requests o aiohttp).
+        
+        Returns:
+            float: Segundos de pausa impuestos (0 si no hubo que pausar).
+        """
+        now = time.time()
+        pause = 0.0
+        retry_after = headers.get("Retry-After")
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+
+        reset_in = None
+        if reset is not None:
+            try:
+                reset_value = float(reset)
+                # Algunas APIs envían un timestamp epoch en lugar de segundos
+                reset_in = reset_value - now if reset_value > 1e9 else reset_value
+            except ValueError:
+                pass
+
+        if retry_after:
+            try:
+                pause = float(retry_after)
+            except ValueError:
+                # Formato HTTP-date
+                try:
+                    pause = parsedate_to_datetime(retry_after).timestamp() - now
+                except (TypeError, ValueError):
+                    pause = 0.0
+        elif remaining == "0":
+            pause = reset_in if reset_in is not None else 1.0
+        elif remaining is not None and reset_in and reset_in > 0:
+            try:
+                self.rate = max(0.1, min(self.max_rate, int(remaining) / reset_in))
+            except ValueError:
+                pass
+
+        if pause > 0:
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            return pause
+        return 0.0
 
 
 class EBSCOScraper:
@@ -49,6 +489,7 @@ class EBSCOScraper:
         headers (dict): Headers HTTP para las peticiones
         cookies (dict): Cookies de sesión para autenticación
         total_items (int): Número total de resultados disponibles
+        rate_limit_rps (float): Máximo de peticiones por segundo a la API
     
     Example:
         >>> scraper = EBSCOScraper(auto_login=True)
@@ -56,7 +497,13 @@ class EBSCOScraper:
         >>> scraper.save_to_csv(articles, "ml_articles.csv")
     """
     
-    def __init__(self, auto_login: bool = True):
+    def __init__(
+        self,
+        auto_login: bool = True,
+        rate_limit_rps: float = 10.0,
+        cache_path: Optional[str] = None,
+        cache_ttl: Optional[float] = _CACHE_TTL_SECONDS,
+    ):
         """
         Inicializa el scraper de EBSCO.
         
@@ -67,6 +514,18 @@ class EBSCOScraper:
         Args:
             auto_login (bool, optional): Si es True, intenta autenticarse
                 automáticamente al inicializar. Por defecto True.
+            rate_limit_rps (float, optional): Máximo de peticiones por segundo
+                a la API. Solo se espera si el ritmo real lo supera. Por defecto 10.0.
+            cache_path (Optional[str], optional): Archivo SQLite donde guardar
+                las respuestas crudas de search() por (query, offset, count).
+                Pensada para reanudar un scraping interrumpido o repetir una
+                ejecución: los reintentos y re-ejecuciones leen de disco en
+                lugar de volver a la red, así que los resultados pueden no ser
+                los actuales de EBSCO. Usar ":memory:" para una caché solo de
+                la sesión. Por defecto None (sin caché).
+            cache_ttl (Optional[float], optional): Segundos que una página
+                cacheada sigue siendo válida; pasado ese tiempo se vuelve a
+                pedir a la API. None = sin caducidad. Por defecto 24 horas.
         
         Raises:
             Exception: Si el auto_login falla y no se puede establecer sesión
@@ -79,12 +538,28 @@ class EBSCOScraper:
         # Sesión HTTP para mantener cookies entre peticiones
         self.session = requests.Session()
         
+        # Pool de conexiones keep-alive: las peticiones sucesivas reutilizan el
+        # mismo socket TLS en vez de repetir el handshake en cada batch.
+        # Las búsquedas son POST de solo lectura, así que se pueden reintentar.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset({"GET", "POST"}),
+            ),
+        )
+        self.session.mount("https://", adapter)
+        
         # URL de acceso institucional con proxy de autenticación
         self.login_url = "https://login.intelproxy.com/v2/inicio?cuenta=7Ah6RNpGWF22jjyq&url=ezp.2aHR0cHM6Ly9zZWFyY2guZWJzY29ob3N0LmNvbS9sb2dpbi5hc3B4PyZkaXJlY3Q9dHJ1ZSZzaXRlPWVkcy1saXZlJmF1dGh0eXBlPWlwJmN1c3RpZD1uczAwNDM2MyZnZW9jdXN0aWQ9Jmdyb3VwaWQ9bWFpbiZwcm9maWxlPWVkcyZicXVlcnk9Z2VuZXJhdGl2ZSthcnRpZmljaWFsK2ludGVsbGlnZW5jZQ--"
         
         # Headers HTTP que simulan un navegador real
         self.headers = {
             "Accept": "application/json, text/plain, */*",
+            "Accept-Encoding": _ACCEPT_ENCODING,  # JSON muy comprimible
             "Content-Type": "application/json",
             "Origin": "https://research-ebsco-com.crai.referencistas.com",
             "Referer": "https://research-ebsco-com.crai.referencistas.com/",
@@ -97,6 +572,36 @@ class EBSCOScraper:
             "x-eis-gateway-referrer-from-ui": "same-site",
             "x-initiated-by": "refresh",
         }
+        self.session.headers.update(self.headers)
+
+        # Query params fijos de la API, construidos una sola vez
+        self._params = {
+            "applyAllLimiters": "true",  # Aplicar todos los filtros
+            "includeSavedItems": "false",  # No incluir items guardados
+            "excludeLinkValidation": "true",  # Excluir validación de enlaces
+        }
+
+        # Plantilla del payload de búsqueda; _build_payload() solo ajusta
+        # query/offset/count sobre una copia
+        self._payload_template = {
+            "advancedSearchStrategy": "NONE",  # Búsqueda simple (no avanzada)
+            "query": "",  # Término de búsqueda
+            "autoCorrect": False,  # No corregir automáticamente errores
+            "profileIdentifier": "q46rpe",  # ID del perfil institucional
+            "expanders": ["thesaurus", "concept"],  # Expandir con sinónimos y conceptos
+            "filters": [
+                {"id": "FT", "values": ["true"]},  # Solo texto completo (Full Text)
+                {"id": "FT1", "values": ["true"]},  # Texto completo disponible
+            ],
+            "searchMode": "all",  # Buscar TODAS las palabras (AND)
+            "sort": "relevance",  # Ordenar por relevancia
+            "isNovelistEnabled": False,  # No incluir contenido de Novelist
+            "includePlacards": True,  # Incluir anuncios/destacados
+            "offset": 0,  # Posición inicial (paginación)
+            "count": 50,  # Número de resultados a retornar
+            "highlightTag": "mark",  # Tag HTML para resaltar coincidencias
+            "userDirectAction": False,  # No es acción directa del usuario
+        }
 
         # Diccionario para almacenar cookies de sesión
         self.cookies = {}
@@ -104,10 +609,30 @@ class EBSCOScraper:
         # Variable para almacenar el total de resultados disponibles
         self.total_items = None
 
+        # Hash (ruta, blake2b) del último archivo de cookies escrito
+        self._last_cookie_hash = None
+
+        # Momento (time.monotonic) de la última validación exitosa de cookies
+        self._cookies_validated_at = 0.0
+
+        # Token bucket compartido por search() y el pipeline asíncrono
+        self._rate_limiter = RateLimiter(rate_limit_rps)
+
+        # Caché opcional de respuestas de la API (SQLite)
+        self._cache = self._open_cache(cache_path) if cache_path else None
+        self._cache_ttl = cache_ttl
+        self._cache_lock = threading.Lock()
+
+        # Playwright y navegador compartidos entre intentos de login (lazy)
+        self._pw = None
+        self._browser = None
+        self._browser_headless = None
+
         # Proceso de autenticación automática
         if auto_login:
-            # Intentar cargar cookies existentes primero
-            if not (self.load_cookies() and self.test_cookies()):
+            # Intentar cargar cookies existentes primero; si expiraron, intentar
+            # renovarlas solo con HTTP antes de abrir el navegador
+            if not (self.load_cookies() and (self.test_cookies() or self.refresh_session())):
                 print("Cookies no válidas o no encontradas. Iniciando login manual...")
                 self.manual_login()
 
@@ -146,58 +671,48 @@ class EBSCOScraper:
         print("2. Navega hasta la página principal de EBSCO")
         print("3. Presiona Enter en esta consola cuando estés listo")
         
-        # Iniciar Playwright para automatizar el navegador
-        with sync_playwright() as p:
-            # Lanzar navegador Chromium visible (headless=False)
-            browser = p.chromium.launch(headless=False)
-            
-            # Crear contexto con user agent personalizado
-            context = browser.new_context(
-                user_agent=self.headers["User-Agent"]
-            )
-            page = context.new_page()
+        # Reutilizar el navegador compartido (visible) y abrir un contexto nuevo
+        browser = self._get_browser(headless=False)
+        
+        # Crear contexto con user agent personalizado
+        context = browser.new_context(
+            user_agent=self.headers["User-Agent"],
+            storage_state=self._existing_storage_state(),
+        )
+        page = context.new_page()
 
-            try:
-                # Navegar a la página de login institucional
-                page.goto(self.login_url)
-                
-                # Esperar confirmación del usuario
-                print("\nPor favor completa el login en el navegador...")
-                print("Presiona Enter cuando hayas terminado y estés en EBSCO:")
-                input()
-                
-                # Verificar que estamos en la página correcta de EBSCO
-                current_url = page.url
-                if "ebsco" not in current_url.lower() and "crai.referencistas" not in current_url:
-                    print("Navegando a EBSCO...")
-                    ebsco_url = "https://research-ebsco-com.crai.referencistas.com/"
-                    page.goto(ebsco_url)
-                    page.wait_for_timeout(3000)
-                
-                # Extraer todas las cookies del contexto del navegador
-                cookies = context.cookies()
-                safe_cookies: Dict[str, str] = {}
-                for c in cookies:
-                    name = c.get("name")
-                    value = c.get("value")
-                    if name and value:
-                        safe_cookies[name] = value
-                
-                # Almacenar cookies en la instancia
-                self.cookies = safe_cookies
-                print(f"Cookies extraídas: {len(self.cookies)} cookies")
-                
-                # Guardar cookies en archivo para uso futuro
-                self.save_cookies()
-                
-                print("✓ Login completado exitosamente")
+        try:
+            # Navegar a la página de login institucional
+            page.goto(self.login_url)
+            
+            # Esperar confirmación del usuario
+            print("\nPor favor completa el login en el navegador...")
+            print("Presiona Enter cuando hayas terminado y estés en EBSCO:")
+            input()
+            
+            # Verificar que estamos en la página correcta de EBSCO
+            current_url = page.url
+            if "ebsco" not in current_url.lower() and "crai.referencistas" not in current_url:
+                print("Navegando a EBSCO...")
+                ebsco_url = "https://research-ebsco-com.crai.referencistas.com/"
+                page.goto(ebsco_url)
+                page.wait_for_load_state("networkidle")
+            
+            # Extraer todas las cookies del contexto y almacenarlas en la instancia
+            self._save_storage_state(context)
+            print(f"Cookies extraídas: {len(self.cookies)} cookies")
+            
+            # Guardar cookies en archivo para uso futuro
+            self.save_cookies()
+            
+            print("✓ Login completado exitosamente")
 
-            except Exception as e:
-                print(f"Error durante el login manual: {e}")
-                raise
-            finally:
-                # Cerrar navegador siempre, incluso si hay errores
-                browser.close()
+        except Exception as e:
+            print(f"Error durante el login manual: {e}")
+            raise
+        finally:
+            # Cerrar el contexto siempre; el navegador queda para otros intentos
+            context.close()
 
     def login_with_persistent_browser(self):
         """
@@ -234,48 +749,40 @@ class EBSCOScraper:
         profile_dir = "./browser_profile"
         os.makedirs(profile_dir, exist_ok=True)
         
-        with sync_playwright() as p:
-            # Lanzar navegador con contexto persistente
-            # Esto guarda cookies, localStorage, etc. en disco
-            browser = p.chromium.launch_persistent_context(
-                user_data_dir=profile_dir,
-                headless=False,
-                user_agent=self.headers["User-Agent"]
-            )
+        # Lanzar navegador con contexto persistente
+        # Esto guarda cookies, localStorage, etc. en disco
+        # (no puede compartir el navegador de _get_browser(): tiene su propio perfil)
+        browser = self._get_playwright().chromium.launch_persistent_context(
+            user_data_dir=profile_dir,
+            headless=False,
+            user_agent=self.headers["User-Agent"]
+        )
+        
+        try:
+            page = browser.new_page()
+            page.goto(self.login_url)
             
-            try:
-                page = browser.new_page()
-                page.goto(self.login_url)
-                
-                print("Completa el login en el navegador...")
-                print("El navegador guardará tu sesión para futuros usos.")
-                print("Presiona Enter cuando hayas completado el login:")
-                input()
-                
-                # Navegar a EBSCO si no estamos ahí ya
-                if "ebsco" not in page.url.lower():
-                    page.goto("https://research-ebsco-com.crai.referencistas.com/")
-                    page.wait_for_timeout(3000)
-                
-                # Extraer cookies del contexto persistente
-                cookies = browser.cookies()
-                safe_cookies: Dict[str, str] = {}
-                for c in cookies:
-                    name = c.get("name")
-                    value = c.get("value")
-                    if name and value:
-                        safe_cookies[name] = value
-                
-                self.cookies = safe_cookies
-                self.save_cookies()
-                
-                print("✓ Login con perfil persistente completado")
+            print("Completa el login en el navegador...")
+            print("El navegador guardará tu sesión para futuros usos.")
+            print("Presiona Enter cuando hayas completado el login:")
+            input()
+            
+            # Navegar a EBSCO si no estamos ahí ya
+            if "ebsco" not in page.url.lower():
+                page.goto("https://research-ebsco-com.crai.referencistas.com/")
+                page.wait_for_load_state("networkidle")
+            
+            # Extraer cookies del contexto persistente
+            self._save_storage_state(browser)
+            self.save_cookies()
+            
+            print("✓ Login con perfil persistente completado")
 
-            except Exception as e:
-                print(f"Error con perfil persistente: {e}")
-                raise
-            finally:
-                browser.close()
+        except Exception as e:
+            print(f"Error con perfil persistente: {e}")
+            raise
+        finally:
+            browser.close()
 
     def login_and_get_cookies(self, email: Optional[str] = None, password: Optional[str] = None, headless: bool = False):
         """
@@ -328,368 +835,468 @@ class EBSCOScraper:
         """
         print("Iniciando proceso de autenticación...")
         
-        with sync_playwright() as p:
-            # Configurar navegador con argumentos anti-detección
-            browser = p.chromium.launch(
-                headless=headless,
-                args=[
-                    '--disable-blink-features=AutomationControlled',  # Oculta que es automatizado
-                    '--disable-dev-shm-usage',  # Mejora rendimiento en Linux
-                    '--no-sandbox',  # Necesario en algunos entornos
-                    '--disable-extensions',  # Desactiva extensiones
-                    '--disable-plugins-discovery',
-                    '--disable-web-security',  # Solo para testing
-                    '--disable-features=VizDisplayCompositor'
-                ]
-            )
+        # Navegador compartido (lanzado con argumentos anti-detección)
+        browser = self._get_browser(headless=headless)
+        
+        # Crear contexto con configuración realista
+        context = browser.new_context(
+            user_agent=self.headers["User-Agent"],
+            storage_state=self._existing_storage_state(),  # Restaurar sesión previa
+            viewport={'width': 1920, 'height': 1080},  # Resolución común
+            extra_http_headers={
+                'Accept-Language': 'es-ES,es;q=0.9,en;q=0.8',
+            }
+        )
+        
+        # Inyectar script para ocultar propiedades de automatización
+        context.add_init_script("""
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => undefined,
+            });
+            window.chrome = {
+                runtime: {}
+            };
+        """)
+        
+        page = context.new_page()
+
+        try:
+            print("Navegando a la página de login...")
+            # Esperar a que la red esté inactiva (página completamente cargada)
+            # (los elementos dinámicos se esperan luego con locators)
+            page.goto(self.login_url, wait_until='networkidle')
             
-            # Crear contexto con configuración realista
-            context = browser.new_context(
-                user_agent=self.headers["User-Agent"],
-                viewport={'width': 1920, 'height': 1080},  # Resolución común
-                extra_http_headers={
-                    'Accept-Language': 'es-ES,es;q=0.9,en;q=0.8',
-                }
-            )
+            print("Buscando botón de Google...")
             
-            # Inyectar script para ocultar propiedades de automatización
-            context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                });
-                window.chrome = {
-                    runtime: {}
-                };
-            """)
+            # Tomar screenshot para debugging (guardar en carpeta organizada)
+            screenshots_dir = os.path.join("data", "screenshots")
+            os.makedirs(screenshots_dir, exist_ok=True)
+            screenshot_path = os.path.join(screenshots_dir, "login_page_debug.png")
+            page.screenshot(path=screenshot_path)
+            print(f"Screenshot guardado como '{screenshot_path}'")
             
-            page = context.new_page()
-
-            try:
-                print("Navegando a la página de login...")
-                # Esperar a que la red esté inactiva (página completamente cargada)
-                page.goto(self.login_url, wait_until='networkidle')
-                
-                # Esperar tiempo adicional para JavaScript dinámico
-                page.wait_for_timeout(5000)
-                
-                print("Buscando botón de Google...")
-                
-                # Tomar screenshot para debugging (guardar en carpeta organizada)
-                screenshots_dir = os.path.join("data", "screenshots")
-                os.makedirs(screenshots_dir, exist_ok=True)
-                screenshot_path = os.path.join(screenshots_dir, "login_page_debug.png")
-                page.screenshot(path=screenshot_path)
-                print(f"Screenshot guardado como '{screenshot_path}'")
+            # Buscar el botón de Google con todos los selectores a la vez
+            google_button = self._wait_first_visible(page, _GOOGLE_LOCATOR, timeout=10000)
+            if google_button:
+                print("✓ Botón de Google encontrado")
+            
+            if not google_button:
+                # No se encontró botón de Google
+                print("❌ No se encontró botón de Google")
+                if not headless:
+                    print("Cambiando a modo manual...")
+                    input("Por favor, realiza el login manualmente y presiona Enter...")
+                else:
+                    # Si estamos en headless, reintentar en modo visible
+                    context.close()
+                    return self.manual_login()
+            else:
+                # ===== LOGIN AUTOMÁTICO DE GOOGLE =====
+                print("🚀 Iniciando login automático...")
                 
-                # Lista exhaustiva de selectores para encontrar el botón de Google
-                google_selectors = [
-                    'button:has-text("Google")',
-                    'a:has-text("Google")',
-                    'button:has-text("Gmail")',
-                    'a:has-text("Gmail")',
-                    '[data-provider="google"]',
-                    '.google-login',
-                    '#google-login',
-                    'button[title*="Google"]',
-                    'a[href*="google"]',
-                    'button[class*="google"]',
-                    'a[class*="google"]',
-                    'button:has([class*="google"])',
-                    'a:has([class*="google"])',
-                    'div[role="button"]:has-text("Google")',
-                ]
+                # Hacer scroll al botón si es necesario
+                google_button.scroll_into_view_if_needed()
+                google_button.click()
+                print("✓ Click en botón de Google")
                 
-                # Intentar encontrar botón de Google con múltiples selectores
-                google_button = None
-                for selector in google_selectors:
-                    try:
-                        element = page.wait_for_selector(selector, timeout=3000)
-                        if element and element.is_visible():
-                            print(f"✓ Botón de Google encontrado: {selector}")
-                            google_button = element
-                            break
-                    except:
-                        continue
+                # Esperar redirección a Google (continúa en cuanto cambia la URL)
+                try:
+                    page.wait_for_url(
+                        lambda url: "google" in url.lower() or "accounts.google.com" in url,
+                        timeout=15000,
+                    )
+                except PlaywrightTimeoutError:
+                    pass
                 
-                if not google_button:
-                    # No se encontró botón de Google
-                    print("❌ No se encontró botón de Google")
-                    if not headless:
-                        print("Cambiando a modo manual...")
-                        input("Por favor, realiza el login manualmente y presiona Enter...")
-                    else:
-                        # Si estamos en headless, reintentar en modo visible
-                        browser.close()
-                        return self.manual_login()
-                else:
-                    # ===== LOGIN AUTOMÁTICO DE GOOGLE =====
-                    print("🚀 Iniciando login automático...")
+                # Verificar que estamos en la página de login de Google
+                if "google" in page.url.lower() or "accounts.google.com" in page.url:
+                    print("✓ Redirigido a Google")
                     
-                    # Hacer scroll al botón si es necesario
-                    google_button.scroll_into_view_if_needed()
-                    page.wait_for_timeout(1000)
-                    google_button.click()
-                    print("✓ Click en botón de Google")
-                    
-                    # Esperar redirección a Google
-                    page.wait_for_timeout(3000)
-                    
-                    # Verificar que estamos en la página de login de Google
-                    if "google" in page.url.lower() or "accounts.google.com" in page.url:
-                        print("✓ Redirigido a Google")
+                    if email and password:
+                        # === AUTOMATIZAR LOGIN COMPLETO ===
+                        print("🔑 Automatizando login con credenciales...")
                         
-                        if email and password:
-                            # === AUTOMATIZAR LOGIN COMPLETO ===
-                            print("🔑 Automatizando login con credenciales...")
+                        try:
+                            # ===== PASO 1: INGRESAR EMAIL =====
+                            print("Ingresando email...")
+                            email_input = self._wait_first_visible(page, _EMAIL_LOCATOR, timeout=10000)
+                            if email_input:
+                                print("✓ Campo email encontrado")
                             
-                            try:
-                                # ===== PASO 1: INGRESAR EMAIL =====
-                                print("Ingresando email...")
-                                email_selectors = [
-                                    'input[type="email"]',
-                                    'input[name="identifier"]',
-                                    'input[id="identifierId"]',
-                                    '#Email',
-                                    'input[aria-label*="email"]',
-                                    'input[aria-label*="correo"]'
-                                ]
+                            if email_input:
+                                # Limpiar campo y escribir email
+                                email_input.click()
+                                page.keyboard.press("Control+a")
+                                email_input.fill(email)
                                 
-                                email_input = None
-                                for selector in email_selectors:
-                                    try:
-                                        email_input = page.wait_for_selector(selector, timeout=5000)
-                                        if email_input and email_input.is_visible():
-                                            print(f"✓ Campo email encontrado: {selector}")
-                                            break
-                                    except:
-                                        continue
+                                next_button = self._wait_first_visible(page, _NEXT_LOCATOR, timeout=5000)
+                                if next_button:
+                                    print("✓ Botón siguiente encontrado")
                                 
-                                if email_input:
-                                    # Limpiar campo y escribir email
-                                    email_input.click()
-                                    page.keyboard.press("Control+a")
-                                    email_input.fill(email)
-                                    page.wait_for_timeout(1000)
-                                    
-                                    # Buscar botón "Siguiente"
-                                    next_selectors = [
-                                        'button:has-text("Next")',
-                                        'button:has-text("Siguiente")',
-                                        'input[type="submit"]',
-                                        '#identifierNext',
-                                        'button[id*="next"]',
-                                        'button[class*="next"]'
-                                    ]
-                                    
-                                    next_button = None
-                                    for selector in next_selectors:
-                                        try:
-                                            next_button = page.wait_for_selector(selector, timeout=3000)
-                                            if next_button and next_button.is_visible():
-                                                print(f"✓ Botón siguiente encontrado: {selector}")
-                                                break
-                                        except:
-                                            continue
-                                    
-                                    if next_button:
-                                        next_button.click()
-                                        print("✓ Email enviado")
-                                    else:
-                                        # Fallback: presionar Enter
-                                        page.keyboard.press("Enter")
-                                        print("✓ Enter presionado para email")
-                                    
-                                    page.wait_for_timeout(3000)
+                                if next_button:
+                                    next_button.click()
+                                    print("✓ Email enviado")
                                 else:
-                                    raise Exception("No se encontró campo de email")
-                                
-                                # ===== PASO 2: INGRESAR CONTRASEÑA =====
-                                print("Esperando campo de contraseña...")
-                                password_selectors = [
-                                    'input[type="password"]',
-                                    'input[name="password"]',
-                                    'input[aria-label*="password"]',
-                                    'input[aria-label*="contraseña"]',
-                                    '#password',
-                                    'input[name="Passwd"]'
-                                ]
+                                    # Fallback: presionar Enter
+                                    page.keyboard.press("Enter")
+                                    print("✓ Enter presionado para email")
+                            else:
+                                raise Exception("No se encontró campo de email")
+                            
+                            # ===== PASO 2: INGRESAR CONTRASEÑA =====
+                            print("Esperando campo de contraseña...")
+                            password_input = self._wait_first_visible(page, _PASSWORD_LOCATOR, timeout=15000)
+                            if password_input:
+                                print("✓ Campo contraseña encontrado")
+                            
+                            if password_input:
+                                # Escribir contraseña
+                                password_input.click()
+                                password_input.fill(password)
                                 
-                                password_input = None
-                                for selector in password_selectors:
-                                    try:
-                                        password_input = page.wait_for_selector(selector, timeout=10000)
-                                        if password_input and password_input.is_visible():
-                                            print(f"✓ Campo contraseña encontrado: {selector}")
-                                            break
-                                    except:
-                                        continue
+                                login_button = self._wait_first_visible(page, _LOGIN_LOCATOR, timeout=5000)
+                                if login_button:
+                                    print("✓ Botón login encontrado")
                                 
-                                if password_input:
-                                    # Escribir contraseña
-                                    password_input.click()
-                                    password_input.fill(password)
-                                    page.wait_for_timeout(1000)
-                                    
-                                    # Buscar botón para enviar contraseña
-                                    login_selectors = [
-                                        'button:has-text("Next")',
-                                        'button:has-text("Siguiente")',
-                                        'button:has-text("Sign in")',
-                                        'button:has-text("Iniciar sesión")',
-                                        'input[type="submit"]',
-                                        '#passwordNext',
-                                        'button[id*="next"]'
-                                    ]
-                                    
-                                    login_button = None
-                                    for selector in login_selectors:
-                                        try:
-                                            login_button = page.wait_for_selector(selector, timeout=3000)
-                                            if login_button and login_button.is_visible():
-                                                print(f"✓ Botón login encontrado: {selector}")
-                                                break
-                                        except:
-                                            continue
-                                    
-                                    if login_button:
-                                        login_button.click()
-                                        print("✓ Contraseña enviada")
-                                    else:
-                                        page.keyboard.press("Enter")
-                                        print("✓ Enter presionado para contraseña")
-                                    
-                                    print("⏳ Esperando completar autenticación...")
-                                    page.wait_for_timeout(5000)
-                                    
+                                if login_button:
+                                    login_button.click()
+                                    print("✓ Contraseña enviada")
                                 else:
-                                    raise Exception("No se encontró campo de contraseña")
+                                    page.keyboard.press("Enter")
+                                    print("✓ Enter presionado para contraseña")
                                 
-                            except Exception as e:
-                                print(f"❌ Error en login automático: {e}")
-                                if not headless:
-                                    print("🔄 Cambiando a modo manual...")
-                                    input("Completa el login manualmente y presiona Enter...")
-                                else:
-                                    raise
-                        else:
-                            # Sin credenciales - modo manual
-                            print("📝 Sin credenciales - completar manualmente...")
+                                print("⏳ Esperando completar autenticación...")
+                                
+                            else:
+                                raise Exception("No se encontró campo de contraseña")
+                            
+                        except Exception as e:
+                            print(f"❌ Error en login automático: {e}")
                             if not headless:
-                                input("Por favor completa el login de Google y presiona Enter...")
+                                print("🔄 Cambiando a modo manual...")
+                                input("Completa el login manualmente y presiona Enter...")
                             else:
-                                browser.close()
-                                return self.login_and_get_cookies(email, password, headless=False)
+                                raise
                     else:
-                        print("❌ No se redirigió a Google correctamente")
+                        # Sin credenciales - modo manual
+                        print("📝 Sin credenciales - completar manualmente...")
                         if not headless:
-                            input("Por favor completa el login manualmente y presiona Enter...")
-                
-                # ===== VERIFICAR LLEGADA A EBSCO =====
-                print("🔍 Esperando llegada a EBSCO...")
-                for i in range(30):  # 30 segundos máximo
-                    current_url = page.url
-                    if "ebsco" in current_url.lower() or "crai.referencistas" in current_url:
-                        print(f"✅ Llegamos a EBSCO: {current_url}")
-                        break
-                    page.wait_for_timeout(1000)
-                    if i % 5 == 0:
-                        print(f"⏳ Esperando... URL actual: {current_url[:100]}...")
+                            input("Por favor completa el login de Google y presiona Enter...")
+                        else:
+                            context.close()
+                            return self.login_and_get_cookies(email, password, headless=False)
                 else:
-                    # Si no llegamos automáticamente, navegar manualmente
-                    print("⚠️ No llegamos a EBSCO automáticamente, intentando navegar...")
-                    try:
-                        page.goto("https://research-ebsco-com.crai.referencistas.com/")
-                        page.wait_for_timeout(3000)
-                    except:
-                        pass
-                
-                # ===== EXTRAER COOKIES =====
-                cookies = context.cookies()
-                safe_cookies: Dict[str, str] = {}
-                for c in cookies:
-                    name = c.get("name")
-                    value = c.get("value")
-                    if name and value:
-                        safe_cookies[name] = value
-                
-                self.cookies = safe_cookies
-                print(f"🍪 {len(self.cookies)} cookies extraídas")
-                
-                # Guardar cookies para uso futuro
-                self.save_cookies()
+                    print("❌ No se redirigió a Google correctamente")
+                    if not headless:
+                        input("Por favor completa el login manualmente y presiona Enter...")
+            
+            # ===== VERIFICAR LLEGADA A EBSCO =====
+            print("🔍 Esperando llegada a EBSCO...")
+            try:
+                # Un solo wait event-driven (30 segundos máximo) en vez de sondear la URL
+                page.wait_for_url(
+                    lambda url: "ebsco" in url.lower() or "crai.referencistas" in url,
+                    timeout=30000,
+                )
+                print(f"✅ Llegamos a EBSCO: {page.url}")
+            except PlaywrightTimeoutError:
+                # Si no llegamos automáticamente, navegar manualmente
+                print(f"⚠️ No llegamos a EBSCO automáticamente (URL actual: {page.url[:100]}...), intentando navegar...")
+                try:
+                    page.goto("https://research-ebsco-com.crai.referencistas.com/")
+                    page.wait_for_load_state("networkidle")
+                except:
+                    pass
+            
+            # ===== EXTRAER COOKIES =====
+            self._save_storage_state(context)
+            print(f"🍪 {len(self.cookies)} cookies extraídas")
+            
+            # Guardar cookies para uso futuro
+            self.save_cookies()
+            
+            print("🎉 Login completado exitosamente!")
+
+        except Exception as e:
+            print(f"❌ Error durante el login: {e}")
+            if not headless:
+                print("🔄 Fallback a modo manual...")
+                input("Por favor completa el login manualmente y presiona Enter...")
                 
-                print("🎉 Login completado exitosamente!")
+                # Extraer cookies después del login manual
+                try:
+                    self._save_storage_state(context)
+                    self.save_cookies()
+                    print(f"🍪 {len(self.cookies)} cookies guardadas desde login manual")
+                except:
+                    pass
+            else:
+                raise
+        finally:
+            context.close()
 
-            except Exception as e:
-                print(f"❌ Error durante el login: {e}")
-                if not headless:
-                    print("🔄 Fallback a modo manual...")
-                    input("Por favor completa el login manualmente y presiona Enter...")
-                    
-                    # Extraer cookies después del login manual
-                    try:
-                        cookies = context.cookies()
-                        safe_cookies: Dict[str, str] = {}
-                        for c in cookies:
-                            name = c.get("name")
-                            value = c.get("value")
-                            if name and value:
-                                safe_cookies[name] = value
-                        
-                        self.cookies = safe_cookies
-                        self.save_cookies()
-                        print(f"🍪 {len(self.cookies)} cookies guardadas desde login manual")
-                    except:
-                        pass
-                else:
-                    raise
-            finally:
-                browser.close()
+    def _existing_storage_state(self) -> Optional[str]:
+        """Ruta del storage_state guardado, o None si aún no existe."""
+        return _STORAGE_STATE_PATH if os.path.exists(_STORAGE_STATE_PATH) else None
 
-    def save_cookies(self, filename: str = "ebsco_cookies.json"):
+    def _save_storage_state(self, context):
         """
-        Guarda las cookies de sesión en un archivo JSON.
+        Guarda el estado del contexto de Playwright y carga sus cookies.
         
-        Serializa el diccionario de cookies a formato JSON y lo guarda en disco
-        para poder reutilizar la sesión en ejecuciones futuras sin necesidad
-        de volver a hacer login.
+        context.storage_state() vuelca cookies y localStorage en una sola
+        llamada; el archivo permite restaurar la sesión completa en el próximo
+        login (new_context(storage_state=...)), incluidos tokens que EBSCO
+        guarda fuera de las cookies. Las cookies del estado alimentan además
+        la sesión HTTP usada por search().
         
         Args:
-            filename (str, optional): Nombre del archivo donde guardar las cookies.
-                Por defecto "ebsco_cookies.json".
+            context: BrowserContext (o contexto persistente) tras el login.
+        """
+        os.makedirs(os.path.dirname(_STORAGE_STATE_PATH), exist_ok=True)
+        state = context.storage_state(path=_STORAGE_STATE_PATH)
+        self._ingest_playwright_cookies(state.get("cookies", []))
+
+    def refresh_session(self) -> bool:
+        """
+        Intenta renovar la sesión sin navegador usando solo requests.
         
-        Note:
-            Las cookies contienen tokens de sesión sensibles. No compartir
-            ni subir a repositorios públicos.
+        Recorre la URL de login institucional con las cookies actuales
+        siguiendo las redirecciones. Si el proxy todavía reconoce la sesión,
+        responde con Set-Cookie nuevas y se evita lanzar Chromium (varios
+        segundos de arranque más la carga de páginas).
         
-        Security:
-            Se recomienda agregar *.json al .gitignore para evitar exponer
-            las cookies en control de versiones.
+        Las cookies se comparan por (dominio, ruta, nombre): los hosts del
+        proxy pueden repetir nombres de cookie y un dict plano nombre → valor
+        haría que unas pisaran a otras. El cookiejar de la sesión se conserva
+        tal cual; en self.cookies solo se actualizan las que cambiaron.
         
         Example:
-            >>> scraper.save_cookies("mi_sesion.json")
-            Cookies guardadas en: mi_sesion.json
+            >>> if scraper.load_cookies() and (scraper.test_cookies() or scraper.refresh_session()):
+            ...     print("Sesión reutilizada")
+        
+        Returns:
+            bool: True si se obtuvieron cookies nuevas y son válidas,
+                False si hace falta un login con Playwright.
         """
-        # Si el usuario no pasó una ruta (solo nombre de archivo), guardamos
-        # en data/cookies/<filename> para mantener el directorio raíz limpio.
-        if not os.path.dirname(filename):
-            cookies_dir = os.path.join("data", "cookies")
-            os.makedirs(cookies_dir, exist_ok=True)
-            fullpath = os.path.join(cookies_dir, filename)
-        else:
-            # Si se pasó una ruta, respetarla (crear carpeta si es necesaria)
-            fullpath = filename
-            parent = os.path.dirname(fullpath)
-            if parent:
-                os.makedirs(parent, exist_ok=True)
-
-        with open(fullpath, 'w', encoding='utf-8') as f:
-            json.dump(self.cookies, f, indent=2)
-        print(f"Cookies guardadas en: {fullpath}")
+        if not self.cookies:
+            return False
 
-    def load_cookies(self, filename: str = "ebsco_cookies.json") -> bool:
+        print("🔄 Intentando renovar la sesión sin navegador...")
+        before = self._cookie_jar_snapshot()
+        try:
+            response = self.session.get(self.login_url, allow_redirects=True, timeout=15)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"✗ Renovación silenciosa fallida: {e}")
+            return False
+
+        refreshed = self._cookie_jar_snapshot()
+        changed = {key: value for key, value in refreshed.items() if before.get(key) != value}
+        if not changed:
+            print("✗ El proxy no entregó cookies nuevas")
+            return False
+
+        self.cookies.update({name: value for (_, _, name), value in changed.items()})
+        if not self.test_cookies():
+            return False
+
+        self.save_cookies()
+        print("✓ Sesión renovada sin navegador")
+        return True
+
+    def _cookie_jar_snapshot(self) -> Dict[Tuple[str, str, str], Optional[str]]:
+        """Valores del cookiejar de la sesión indexados por (dominio, ruta, nombre)."""
+        return {(c.domain, c.path, c.name): c.value for c in self.session.cookies}
+
+    def _ingest_playwright_cookies(self, pw_cookies: List[Dict[str, Any]]):
         """
-        Carga cookies de sesión desde un archivo JSON.
+        Carga en el scraper las cookies extraídas de un contexto de Playwright.
+        
+        Actualiza self.cookies (formato simple nombre → valor, el que se guarda
+        en disco) y el cookiejar de la sesión HTTP conservando dominio y ruta
+        de cada cookie, para que requests las enrute igual que el navegador.
+        
+        Args:
+            pw_cookies (List[Dict[str, Any]]): Cookies en formato Playwright
+                (context.cookies() o storage_state()["cookies"]).
+        """
+        self.cookies = {
+            c["name"]: c["value"] for c in pw_cookies if c.get("name") and c.get("value")
+        }
+        self._cookies_validated_at = 0.0
+        self.session.cookies.clear()
+        for c in pw_cookies:
+            if c.get("name") and c.get("value"):
+                self.session.cookies.set(
+                    c["name"], c["value"], domain=c.get("domain", ""), path=c.get("path", "/")
+                )
+
+    def _sync_session_cookies(self):
+        """
+        Copia self.cookies al cookiejar de la sesión HTTP.
+        
+        Se llama una vez tras cargar cookies desde disco, de modo que las
+        peticiones no tengan que pasar cookies=... (requests reconstruye el
+        cookiejar en cada llamada cuando se pasan por parámetro).
+        """
+        self._cookies_validated_at = 0.0
+        self.session.cookies.clear()
+        requests.utils.add_dict_to_cookiejar(self.session.cookies, self.cookies)
+
+    def _get_playwright(self):
+        """Inicia Playwright una sola vez y reutiliza la instancia."""
+        if self._pw is None:
+            self._pw = sync_playwright().start()
+        return self._pw
+
+    def _get_browser(self, headless: bool = False):
+        """
+        Retorna el Chromium compartido, lanzándolo solo si hace falta.
+        
+        Arrancar Chromium cuesta varios segundos, así que los métodos de login
+        solo crean un contexto nuevo por intento. Si se pide otro modo
+        (headless vs visible) se relanza el navegador.
+        
+        Args:
+            headless (bool, optional): Modo del navegador. Por defecto False.
+        
+        Returns:
+            Browser: Navegador de Playwright listo para new_context().
+        """
+        if self._browser is not None:
+            if self._browser.is_connected() and self._browser_headless == headless:
+                return self._browser
+            try:
+                self._browser.close()
+            except Exception:
+                pass
+
+        self._browser = self._get_playwright().chromium.launch(
+            headless=headless, args=_CHROMIUM_ARGS
+        )
+        self._browser_headless = headless
+        return self._browser
+
+    def _close_browser(self):
+        """
+        Cierra el navegador compartido y detiene Playwright.
+        
+        Note:
+            La API síncrona de Playwright mantiene su propio event loop activo,
+            así que debe detenerse antes de cualquier asyncio.run().
+        """
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+            self._browser_headless = None
+        if self._pw is not None:
+            self._pw.stop()
+            self._pw = None
+
+    def _run_async(self, coro):
+        """Ejecuta una corrutina tras liberar el navegador de los logins."""
+        self._close_browser()
+        return asyncio.run(coro)
+
+    def close(self):
+        """
+        Libera los recursos del scraper (navegador, Playwright y conexiones HTTP).
+        
+        Cierra las conexiones keep-alive del pool de la sesión requests; si
+        el scraper se vuelve a usar, la sesión abre conexiones nuevas.
+        
+        Example:
+            >>> with EBSCOScraper(auto_login=True) as scraper:
+            ...     articles = scraper.scrape_all("robotics", max_results=50)
+        """
+        self._close_browser()
+        self.session.close()
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _wait_first_visible(self, page, selector: str, timeout: int = 10000):
+        """
+        Espera al primer elemento visible que coincida con el selector.
+        
+        El selector es una unión CSS ("a, b, c") de las alternativas del mismo
+        elemento (ver constantes _*_LOCATOR), que Playwright evalúa en una
+        sola consulta. Así el peor caso es un solo timeout en lugar de la
+        suma de un timeout por selector probado en serie.
+        
+        Args:
+            page: Página de Playwright donde buscar.
+            selector (str): Unión CSS de selectores alternativos.
+            timeout (int, optional): Milisegundos máximos de espera. Por defecto 10000.
+        
+        Returns:
+            Locator o None: Locator del elemento encontrado, o None si no
+                apareció ninguno dentro del timeout.
+        """
+        locator = page.locator(selector).first
+        try:
+            locator.wait_for(state="visible", timeout=timeout)
+            return locator
+        except PlaywrightTimeoutError:
+            return None
+
+    def save_cookies(self, filename: str = "ebsco_cookies.json"):
+        """
+        Guarda las cookies de sesión en un archivo JSON.
+        
+        Serializa el diccionario de cookies a formato JSON y lo guarda en disco
+        para poder reutilizar la sesión en ejecuciones futuras sin necesidad
+        de volver a hacer login.
+        
+        Args:
+            filename (str, optional): Nombre del archivo donde guardar las cookies.
+                Por defecto "ebsco_cookies.json".
+        
+        Note:
+            Las cookies contienen tokens de sesión sensibles. No compartir
+            ni subir a repositorios públicos.
+        
+        Security:
+            Se recomienda agregar *.json al .gitignore para evitar exponer
+            las cookies en control de versiones.
+        
+        Performance:
+            Si las cookies serializadas son idénticas a las últimas escritas
+            en la misma ruta, no se vuelve a escribir el archivo.
+        
+        Example:
+            >>> scraper.save_cookies("mi_sesion.json")
+            Cookies guardadas en: mi_sesion.json
+        """
+        # Si el usuario no pasó una ruta (solo nombre de archivo), guardamos
+        # en data/cookies/<filename> para mantener el directorio raíz limpio.
+        fullpath = self._resolve_output_path(filename, os.path.join("data", "cookies"))
+
+        # Evitar reescribir el archivo si el contenido no cambió (caso común
+        # al repetir login con el perfil persistente)
+        payload = orjson.dumps(self.cookies)
+        digest = (fullpath, hashlib.blake2b(payload, digest_size=16).digest())
+        if digest == self._last_cookie_hash and os.path.exists(fullpath):
+            print(f"Cookies sin cambios en: {fullpath}")
+            return
+
+        with open(fullpath, 'wb') as f:
+            f.write(payload)
+        self._last_cookie_hash = digest
+        print(f"Cookies guardadas en: {fullpath}")
+
+    def load_cookies(self, filename: str = "ebsco_cookies.json") -> bool:
+        """
+        Carga cookies de sesión desde un archivo JSON.
         
         Intenta cargar cookies previamente guardadas desde un archivo. Si el
         archivo existe y se carga correctamente, retorna True. Si no existe
@@ -714,8 +1321,9 @@ class EBSCOScraper:
         """
         try:
             if os.path.exists(filename):
-                with open(filename, 'r', encoding='utf-8') as f:
-                    self.cookies = json.load(f)
+                with open(filename, 'rb') as f:
+                    self.cookies = orjson.loads(f.read())
+                self._sync_session_cookies()
                 print(f"Cookies cargadas desde: {filename}")
                 return True
             else:
@@ -746,10 +1354,12 @@ class EBSCOScraper:
             ...     scraper.manual_login()
         """
         try:
-            # Hacer una búsqueda mínima de prueba
-            test_data = self.search("artificial intelligence", offset=0, count=1, verbose=False)
+            # Hacer una búsqueda mínima de prueba, siempre contra la red: una
+            # página cacheada no dice nada de la sesión actual
+            test_data = self.search("artificial intelligence", offset=0, count=1, verbose=False, use_cache=False)
             is_valid = test_data.get('totalItems', 0) >= 0
             if is_valid:
+                self._cookies_validated_at = time.monotonic()
                 print("✓ Cookies válidas")
             else:
                 print("✗ Cookies inválidas")
@@ -790,18 +1400,12 @@ class EBSCOScraper:
         try:
             response = self.session.post(
                 self.base_url,
-                headers=self.headers,
-                cookies=self.cookies,
-                json=payload,
-                params={
-                    "applyAllLimiters": "true",
-                    "includeSavedItems": "false",
-                    "excludeLinkValidation": "true",
-                },
+                data=orjson.dumps(payload),
+                params=self._params,
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             total = data.get("search", {}).get("totalItems", 0)
             print(f"Total de resultados disponibles para '{query}': {total:,}")
             return total
@@ -812,6 +1416,56 @@ class EBSCOScraper:
                 print("Posible problema de autenticación. Cookies pueden haber expirado.")
             return 0
 
+    def _open_cache(self, path: str) -> sqlite3.Connection:
+        """
+        Abre (o crea) la caché SQLite de respuestas de search().
+        
+        WAL + synchronous=NORMAL: cada inserción no fuerza un fsync completo,
+        y la caché sigue siendo consistente si el proceso se interrumpe.
+        """
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        # iter_pages() consulta la caché desde su hilo de prefetch: la
+        # conexión se comparte entre hilos y se serializa con _cache_lock
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "q TEXT, o INTEGER, n INTEGER, body BLOB, ts REAL, PRIMARY KEY (q, o, n))"
+        )
+        # Cachés creadas antes de guardar la fecha: sus filas (ts NULL) se
+        # tratan como caducadas y se reescriben en la siguiente petición
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(pages)")}
+        if "ts" not in columns:
+            conn.execute("ALTER TABLE pages ADD COLUMN ts REAL")
+        return conn
+
+    def _cache_get(self, query: str, offset: int, count: int) -> Optional[bytes]:
+        """Retorna el cuerpo JSON cacheado de una página, o None si no está o caducó."""
+        if self._cache is None:
+            return None
+        with self._cache_lock:
+            row = self._cache.execute(
+                "SELECT body, ts FROM pages WHERE q = ? AND o = ? AND n = ?", (query, offset, count)
+            ).fetchone()
+        if row is None:
+            return None
+        body, stored_at = row
+        if self._cache_ttl is not None and (stored_at is None or time.time() - stored_at > self._cache_ttl):
+            return None
+        return body
+
+    def _cache_put(self, query: str, offset: int, count: int, body: bytes):
+        """Guarda el cuerpo JSON crudo de una página en la caché (si está activa)."""
+        if self._cache is None:
+            return
+        with self._cache_lock, self._cache:
+            self._cache.execute(
+                "INSERT OR REPLACE INTO pages (q, o, n, body, ts) VALUES (?, ?, ?, ?, ?)",
+                (query, offset, count, body, time.time()),
+            )
+
     def _build_payload(self, query: str, offset: int = 0, count: int = 50) -> Dict:
         """
         Construye el payload JSON para las peticiones a la API de EBSCO.
@@ -847,27 +1501,21 @@ class EBSCOScraper:
             Este método es privado (prefijo _) y normalmente no debe ser
             llamado directamente por usuarios de la clase.
         """
-        return {
-            "advancedSearchStrategy": "NONE",  # Búsqueda simple (no avanzada)
-            "query": query,  # Término de búsqueda
-            "autoCorrect": False,  # No corregir automáticamente errores
-            "profileIdentifier": "q46rpe",  # ID del perfil institucional
-            "expanders": ["thesaurus", "concept"],  # Expandir con sinónimos y conceptos
-            "filters": [
-                {"id": "FT", "values": ["true"]},  # Solo texto completo (Full Text)
-                {"id": "FT1", "values": ["true"]},  # Texto completo disponible
-            ],
-            "searchMode": "all",  # Buscar TODAS las palabras (AND)
-            "sort": "relevance",  # Ordenar por relevancia
-            "isNovelistEnabled": False,  # No incluir contenido de Novelist
-            "includePlacards": True,  # Incluir anuncios/destacados
-            "offset": offset,  # Posición inicial (paginación)
-            "count": count,  # Número de resultados a retornar
-            "highlightTag": "mark",  # Tag HTML para resaltar coincidencias
-            "userDirectAction": False,  # No es acción directa del usuario
-        }
+        # Copia superficial de la plantilla: solo cambian query, offset y count
+        payload = self._payload_template.copy()
+        payload["query"] = query
+        payload["offset"] = offset
+        payload["count"] = count
+        return payload
 
-    def search(self, query: str, offset: int = 0, count: int = 50, verbose: bool = True) -> Dict:
+    def search(
+        self,
+        query: str,
+        offset: int = 0,
+        count: int = 50,
+        verbose: bool = True,
+        use_cache: bool = True,
+    ) -> Dict:
         """
         Realiza una búsqueda en la base de datos EBSCO.
         
@@ -884,6 +1532,10 @@ class EBSCOScraper:
                 Por defecto 50.
             verbose (bool, optional): Si es True, imprime información de debug.
                 Por defecto True.
+            use_cache (bool, optional): Si es False, ignora la caché de
+                páginas y siempre pregunta a la API (la respuesta se guarda
+                igual). test_cookies() lo usa para validar la sesión contra la
+                red. Por defecto True.
         
         Returns:
             Dict: Respuesta JSON de la API con los resultados de búsqueda.
@@ -906,32 +1558,54 @@ class EBSCOScraper:
             📡 Status code: 200
             >>> print(f"Encontrados: {results['search']['totalItems']} artículos")
         """
+        cached = self._cache_get(query, offset, count) if use_cache else None
+        if cached is not None:
+            return orjson.loads(cached)
+
         # Construir payload con parámetros de búsqueda
         payload = self._build_payload(query, offset, count)
         
-        # Rate limiting: pequeño delay para evitar bloqueos
-        time.sleep(0.1)
+        # Rate limiting: solo espera si vamos más rápido que rate_limit_rps
+        self._rate_limiter.acquire_sync()
 
-        # Realizar petición POST a la API
+        # Realizar petición POST a la API (headers y cookies viven en la sesión)
         response = self.session.post(
             self.base_url,
-            headers=self.headers,
-            cookies=self.cookies,
-            json=payload,
-            params={
-                "applyAllLimiters": "true",  # Aplicar todos los filtros
-                "includeSavedItems": "false",  # No incluir items guardados
-                "excludeLinkValidation": "true",  # Excluir validación de enlaces
-            },
+            data=orjson.dumps(payload),
+            params=self._params,
         )
 
         if verbose:
             print(f"📡 Query buscado: '{query}'")
             print(f"📡 Status code: {response.status_code}")
 
+        self._rate_limiter.update(response.headers)
+
         # Lanzar excepción si hay error HTTP
         response.raise_for_status()
-        return response.json()
+        data = orjson.loads(response.content)
+        self._cache_put(query, offset, count, response.content)
+        return data
+
+    def iter_articles(self, data: Dict) -> Iterator[Dict]:
+        """
+        Versión generadora de extract_articles(): produce un artículo a la vez.
+        
+        Permite encadenar la extracción directamente con un escritor (por
+        ejemplo un escritor CSV) sin construir la lista intermedia.
+        Cada artículo tiene la misma estructura que en extract_articles().
+        
+        Args:
+            data (Dict): Respuesta JSON de la API obtenida mediante search().
+        
+        Yields:
+            Dict: Metadatos de un artículo.
+        
+        Example:
+            >>> for article in scraper.iter_articles(response):
+            ...     print(article["title"])
+        """
+        return _iter_item_articles(data.get("search", {}).get("items", []))
 
     def extract_articles(self, data: Dict) -> List[Dict]:
         """
@@ -984,83 +1658,281 @@ class EBSCOScraper:
             📄 Extrayendo 5 artículos...
             ✅ 5 artículos extraídos exitosamente
         """
-        articles = []
         # Obtener lista de items de la respuesta JSON
         items = data.get("search", {}).get("items", [])
         
         print(f"📄 Extrayendo {len(items)} artículos...")
-        
-        for item in items:
-            # Extraer y limpiar título
-            title = item.get("title", {}).get("value", "")
-            title = title.replace("<mark>", "").replace("</mark>", "")
-
-            # Extraer y limpiar abstract
-            abstract = item.get("abstract", {}).get("value", "")
-            abstract = abstract.replace("<mark>", "").replace("</mark>", "")
-
-            # Extraer enlaces a PDF
-            pdf_links = []
-            full_text_links = item.get("links", {}).get("fullTextLinks", [])
-            for link in full_text_links:
-                if link.get("type") == "pdfFullText":
-                    pdf_links.append(link.get("url"))
-
-            # Procesar lista de autores
-            authors = []
-            for contrib in item.get("contributors", []):
-                author_name = contrib.get("name", "")
-                if author_name:
-                    authors.append(author_name)
-
-            # Procesar lista de temas/keywords
-            subjects = []
-            for subj in item.get("subjects", []):
-                subject_name = subj.get("name", {}).get("value", "")
-                if subject_name:
-                    subjects.append(subject_name)
-
-            # Construir diccionario con todos los metadatos
-            article = {
-                "id": item.get("id", ""),
-                "title": title,
-                "abstract": abstract,
-                "authors": "; ".join(authors),  # Unir lista con punto y coma
-                "publication_date": item.get("publicationDate", ""),
-                "journal": item.get("source", ""),
-                "doi": item.get("doi", ""),
-                "subjects": "; ".join(subjects),
-                "page_start": item.get("pageStart", ""),
-                "page_end": item.get("pageEnd", ""),
-                "volume": item.get("volume", ""),
-                "issue": item.get("issue", ""),
-                "publisher": item.get("publisherName", ""),
-                "pdf_links": "; ".join(pdf_links),
-                "database": item.get("longDBName", ""),
-                "peer_reviewed": item.get("peerReviewed", False),
-                "language": item.get("language", ""),
-                "document_type": item.get("documentType", ""),
-                "isbn": item.get("isbn", ""),
-                "issn": item.get("issn", ""),
-            }
-            articles.append(article)
-            
+        articles = list(self.iter_articles(data))
         print(f"✅ {len(articles)} artículos extraídos exitosamente")
         return articles
 
+    async def _search_async(
+        self,
+        session: aiohttp.ClientSession,
+        query: str,
+        offset: int,
+        count: int,
+        sem: asyncio.BoundedSemaphore,
+        limiter: Optional[RateLimiter] = None,
+    ) -> Dict:
+        """
+        Versión asíncrona de search() para usar dentro de scrape_all_async().
+        
+        Args:
+            session (aiohttp.ClientSession): Sesión HTTP asíncrona compartida
+                por todas las peticiones del scraping.
+            query (str): Término de búsqueda.
+            offset (int): Posición de inicio para paginación (0-indexed).
+            count (int): Número de resultados a retornar.
+            sem (asyncio.BoundedSemaphore): Semáforo que limita cuántas
+                peticiones hay en vuelo al mismo tiempo.
+            limiter (Optional[RateLimiter], optional): Limitador a usar. Por
+                defecto el del scraper.
+        
+        Returns:
+            Dict: Respuesta JSON de la API (misma estructura que search()).
+        
+        Raises:
+            aiohttp.ClientResponseError: Si la API responde con error HTTP.
+        """
+        cached = self._cache_get(query, offset, count)
+        if cached is not None:
+            return orjson.loads(cached)
+
+        payload = self._build_payload(query, offset, count)
+        limiter = limiter or self._rate_limiter
+
+        async with sem:
+            # Reservar turno en el token bucket sin bloquear el event loop
+            await limiter.acquire()
+            async with session.post(
+                self.base_url, data=orjson.dumps(payload), params=self._params
+            ) as response:
+                pause = limiter.update(response.headers)
+                if pause > 0:
+                    logger.warning("rate limit offset=%d pausa=%.1fs", offset, pause)
+                response.raise_for_status()
+                body = await response.read()
+        data = orjson.loads(body)
+        self._cache_put(query, offset, count, body)
+        return data
+
+    async def _fetch_batch_async(
+        self,
+        session: aiohttp.ClientSession,
+        query: str,
+        offset: int,
+        count: int,
+        sem: asyncio.BoundedSemaphore,
+        limiter: Optional[RateLimiter] = None,
+        max_attempts: int = 3,
+    ) -> Optional[Dict]:
+        """
+        Descarga un batch con reintentos, aislando sus errores del resto.
+        
+        Los errores 401/403 no se reintentan: se propagan para que el
+        wrapper síncrono pueda re-autenticar fuera del event loop (la API
+        síncrona de Playwright no puede ejecutarse dentro de asyncio).
+        
+        Returns:
+            Optional[Dict]: Respuesta JSON del batch, o None si se agotaron
+                los reintentos.
+        """
+        for attempt in range(1, max_attempts + 1):
+            retry_after = None
+            try:
+                return await self._search_async(session, query, offset, count, sem, limiter)
+
+            except aiohttp.ClientResponseError as e:
+                if e.status in (401, 403):
+                    raise
+                if e.status == 429 and e.headers:
+                    retry_after = e.headers.get("Retry-After")
+                logger.warning("error HTTP offset=%d intento=%d/%d: %s", offset, attempt, max_attempts, e)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning("error de red offset=%d intento=%d/%d: %s", offset, attempt, max_attempts, e)
+
+            if attempt < max_attempts:
+                # Backoff exponencial con jitter: ~1.5, 3, 6, ... seg (máx. 60).
+                # El jitter evita que los batches fallidos reintenten a la vez.
+                wait_time = min(60, 1.5 * (2 ** (attempt - 1))) + random.uniform(0, 1)
+                if retry_after is not None:
+                    try:
+                        wait_time = float(retry_after)
+                    except ValueError:
+                        pass
+                logger.info("reintento offset=%d en %.1fs", offset, wait_time)
+                await asyncio.sleep(wait_time)
+
+        logger.error("se omite offset=%d tras %d intentos", offset, max_attempts)
+        return None
+
+    async def scrape_all_async(
+        self,
+        query: str,
+        target_results: int,
+        batch_size: int = 50,
+        delay: float = 0.0,
+        concurrency: int = 10,
+        offsets: Optional[List[int]] = None,
+        on_page: Optional[Callable[[int, List[Dict]], None]] = None,
+    ) -> Tuple[Dict[int, List[Dict]], List[int]]:
+        """
+        Descarga concurrentemente todas las páginas de una búsqueda.
+        
+        Construye de antemano todos los pares (offset, count) y los lanza a la
+        vez. El semáforo limita las peticiones en vuelo, así que el tiempo
+        total pasa de N round-trips en serie a aproximadamente N / concurrency.
+        Las páginas se consumen con asyncio.as_completed: cada una se procesa
+        apenas llega, sin esperar a la más lenta.
+        
+        En scrapings de _PROCESS_POOL_MIN_RESULTS resultados o más, la
+        extracción de artículos se hace en un ProcessPoolExecutor para que el
+        trabajo de CPU no compita con el event loop (ni con el GIL).
+        
+        Args:
+            query (str): Término de búsqueda.
+            target_results (int): Número total de resultados a descargar.
+            batch_size (int, optional): Resultados por petición. Por defecto 50.
+            delay (float, optional): Si es > 0, limita el scraping a una
+                petición cada `delay` segundos (token bucket propio de esta
+                ejecución). Por defecto 0.0 (solo rate_limit_rps).
+            concurrency (int, optional): Máximo de peticiones simultáneas.
+                Por defecto 10.
+            offsets (Optional[List[int]], optional): Offsets concretos a
+                descargar. Si es None, se generan todos los de target_results.
+            on_page (Optional[Callable[[int, List[Dict]], None]], optional): Si
+                se indica, recibe (offset, artículos) de cada página en orden de
+                llegada en lugar de acumularlas. Por defecto None.
+        
+        Returns:
+            Tuple[Dict[int, List[Dict]], List[int]]:
+                - Artículos extraídos indexados por offset (vacío si hay on_page)
+                - Offsets que fallaron por autenticación (401/403)
+        
+        Note:
+            No re-autentica: eso lo hace scrape_all() con los offsets fallidos.
+        """
+        if offsets is None:
+            offsets = list(range(0, target_results, batch_size))
+
+        sem = asyncio.BoundedSemaphore(concurrency)
+        # Todas las peticiones van al mismo host: el límite por host acompaña
+        # al semáforo para no abrir más sockets de los que se usan
+        connector = aiohttp.TCPConnector(
+            limit=max(20, concurrency), limit_per_host=concurrency, ttl_dns_cache=300
+        )
+
+        pages: Dict[int, List[Dict]] = {}
+        auth_failed: List[int] = []
+
+        # Con delay se usa un bucket más lento solo para esta ejecución
+        limiter = (
+            RateLimiter(min(self._rate_limiter.max_rate, 1.0 / delay)) if delay > 0 else None
+        )
+
+        loop = asyncio.get_running_loop()
+        cpu_pool = (
+            ProcessPoolExecutor(max_workers=os.cpu_count())
+            if target_results >= _PROCESS_POOL_MIN_RESULTS else None
+        )
+
+        async def fetch(offset: int):
+            # Asociar cada resultado (o excepción) a su offset
+            try:
+                data = await self._fetch_batch_async(
+                    session, query, offset,
+                    min(batch_size, target_results - offset),
+                    sem, limiter,
+                )
+                if data is None:
+                    return offset, None
+                # Solo se envía la lista de items al otro proceso (menos pickling)
+                items = data.get("search", {}).get("items", [])
+                if cpu_pool is not None:
+                    articles = await loop.run_in_executor(cpu_pool, _extract_articles_pure, items)
+                else:
+                    articles = _extract_articles_pure(items)
+                return offset, articles
+            except Exception as e:
+                return offset, e
+
+        try:
+            async with aiohttp.ClientSession(
+                connector=connector, headers=self.headers, cookies=self.cookies
+            ) as session:
+                # Todas las peticiones se crean de una vez (el semáforo limita las
+                # que están en vuelo) y cada página se procesa en cuanto llega, de
+                # modo que la extracción/escritura se solapa con la red pendiente
+                tasks = [asyncio.create_task(fetch(offset)) for offset in offsets]
+
+                done = 0
+                for next_done in asyncio.as_completed(tasks):
+                    offset, result = await next_done
+                    if isinstance(result, aiohttp.ClientResponseError) and result.status in (401, 403):
+                        auth_failed.append(offset)
+                    elif isinstance(result, BaseException):
+                        logger.error("error inesperado offset=%d: %s", offset, result)
+                    elif result is not None:
+                        done += len(result)
+                        logger.info("offset=%d got=%d total=%d/%d", offset, len(result), done, target_results)
+                        if on_page:
+                            on_page(offset, result)
+                        else:
+                            pages[offset] = result
+        finally:
+            if cpu_pool is not None:
+                cpu_pool.shutdown()
+
+        return pages, auth_failed
+
+    def _prepare_scrape(self, query: str, max_results: Optional[int]) -> int:
+        """
+        Verifica la sesión y calcula cuántos resultados hay que descargar.
+        
+        Paso común de scrape_all() y scrape_all_to_csv(): valida cookies
+        (re-autenticando si hace falta) y consulta el total disponible.
+        
+        Returns:
+            int: Número de resultados objetivo, 0 si la búsqueda no tiene resultados.
+        """
+        print(f"🔍 Iniciando scraping para: '{query}'")
+        
+        # Verificar que las cookies son válidas antes de empezar (salvo que
+        # se acaben de validar: evita un round-trip extra por scraping)
+        if time.monotonic() - self._cookies_validated_at < _COOKIES_FRESH_SECONDS:
+            print("✓ Cookies validadas recientemente")
+        elif not (self.test_cookies() or self.refresh_session()):
+            print("Cookies inválidas. Iniciando re-autenticación...")
+            self.manual_login()
+
+        # Obtener número total de resultados disponibles
+        total_items = self.get_total_items(query)
+
+        if total_items == 0:
+            print("❌ No se encontraron resultados para la búsqueda")
+            return 0
+
+        # Determinar cuántos resultados queremos obtener
+        target_results = min(max_results or total_items, total_items)
+        print(f"🎯 Objetivo: {target_results:,} resultados de {total_items:,} disponibles")
+        return target_results
+
     def scrape_all(
         self,
         query: str,
         max_results: Optional[int] = None,
         batch_size: int = 50,
         delay: float = 0.0,
+        concurrency: int = 10,
     ) -> List[Dict]:
         """
         Realiza scraping completo de múltiples páginas de resultados.
         
         Este es el método principal para extraer grandes cantidades de artículos.
-        Itera sobre todas las páginas de resultados, manejando paginación,
-        rate limiting, errores de red y re-autenticación automática si es necesario.
+        Tras conocer el total de resultados, descarga todas las páginas de forma
+        concurrente (ver scrape_all_async()) y las procesa en orden de offset,
+        manejando rate limiting, errores de red y re-autenticación si es necesario.
         
         Args:
             query (str): Término de búsqueda. Puede incluir operadores booleanos
@@ -1070,29 +1942,33 @@ class EBSCOScraper:
             batch_size (int, optional): Número de resultados por petición (1-50).
                 Valores más altos son más eficientes pero pueden causar timeouts.
                 Por defecto 50.
-            delay (float, optional): Segundos de espera entre peticiones.
-                Se agrega variación aleatoria para parecer más humano.
-                Por defecto 0.0.
+            delay (float, optional): Si es > 0, como máximo una petición cada
+                `delay` segundos. Por defecto 0.0 (solo rate_limit_rps).
+            concurrency (int, optional): Máximo de peticiones simultáneas.
+                Usar 1 para reproducir el comportamiento secuencial.
+                Por defecto 10.
         
         Returns:
             List[Dict]: Lista de todos los artículos extraídos con sus metadatos
                 completos. Ver extract_articles() para estructura de cada artículo.
         
         Features:
-            - Paginación automática
+            - Paginación concurrente con aiohttp + asyncio.as_completed
             - Verificación de cookies antes de empezar
             - Re-autenticación automática si las cookies expiran
-            - Rate limiting inteligente con variación aleatoria
-            - Manejo robusto de errores de red
-            - Reintentos automáticos con backoff exponencial
-            - Límite de errores consecutivos para evitar loops infinitos
-            - Progress tracking detallado
+            - Rate limiting con un token bucket (RateLimiter) compartido por
+              todas las peticiones, recalibrado con las cabeceras
+              X-RateLimit-* de cada respuesta
+            - Reintentos por batch sin detener el resto de páginas
+            - Resultados en el mismo orden que la paginación secuencial
         
         Error Handling:
-            - Máximo 3 errores consecutivos antes de abortar
-            - Re-autenticación automática en errores 401/403
-            - Backoff exponencial: 5 seg, 10 seg, 15 seg
-            - Continúa desde donde se quedó después de errores
+            - Máximo 3 intentos por batch antes de omitirlo
+            - Re-autenticación en errores 401/403 y reintento de esos batches
+            - Backoff exponencial con jitter entre intentos: ~1.5, 3, 6, ...
+              seg (máx. 60) más 0-1 seg aleatorio
+            - En 429 se respeta Retry-After: la espera del reintento y la
+              pausa del RateLimiter para todas las peticiones
         
         Example:
             >>> # Extraer todos los resultados disponibles
@@ -1103,7 +1979,7 @@ class EBSCOScraper:
             ...     query="machine learning",
             ...     max_results=100,
             ...     batch_size=50,
-            ...     delay=1.0  # 1 segundo entre peticiones
+            ...     delay=1.0  # 1 segundo antes de cada petición
             ... )
             
             >>> # Búsqueda con operadores booleanos
@@ -1117,100 +1993,237 @@ class EBSCOScraper:
             ✓ Cookies válidas
             Total de resultados disponibles para 'machine learning': 45,321
             🎯 Objetivo: 100 resultados de 45,321 disponibles
-            📡 Scraping offset 0 - 50 (0/100 completado)
-            📄 Extrayendo 50 artículos...
-            ✅ 50 artículos extraídos exitosamente
-            ⏸️ Esperando 1.2 segundos...
-            📡 Scraping offset 50 - 100 (50/100 completado)
+            📡 Descargando 2 batches (concurrencia 10)...
             🎉 Scraping completado: 100 artículos obtenidos
+            
+            El progreso por batch va al logger del módulo (nivel INFO, ver
+            setup_logging() en main.py), no a stdout:
+            INFO offset=50 got=50 total=50/100
+            INFO offset=0 got=50 total=100/100
         
         Warning:
             - Respetar rate limits de la institución
             - No hacer scraping masivo sin permiso
-            - Considerar agregar delay entre peticiones
+            - Considerar bajar concurrency o agregar delay entre peticiones
             - Algunas instituciones limitan el número de descargas
+            - Usa asyncio.run(), así que no puede llamarse desde un event
+              loop ya activo (usar scrape_all_async() en ese caso)
         """
         
-        print(f"🔍 Iniciando scraping para: '{query}'")
-        
-        # Verificar que las cookies son válidas antes de empezar
-        if not self.test_cookies():
-            print("Cookies inválidas. Iniciando re-autenticación...")
-            self.manual_login()
+        target_results = self._prepare_scrape(query, max_results)
+        if target_results == 0:
+            return []
 
-        # Obtener número total de resultados disponibles
-        total_items = self.get_total_items(query)
+        offsets = list(range(0, target_results, batch_size))
+        print(f"📡 Descargando {len(offsets):,} batches (concurrencia {concurrency})...")
 
-        if total_items == 0:
-            print("❌ No se encontraron resultados para la búsqueda")
-            return []
+        pages, auth_failed = self._run_async(
+            self.scrape_all_async(query, target_results, batch_size, delay, concurrency, offsets)
+        )
 
-        # Determinar cuántos resultados queremos obtener
-        target_results = min(max_results or total_items, total_items)
-        print(f"🎯 Objetivo: {target_results:,} resultados de {total_items:,} disponibles")
+        # Re-autenticar fuera del event loop y reintentar solo lo que falló
+        if auth_failed:
+            print(f"🔑 Error de autenticación en {len(auth_failed)} batches. Reautenticando...")
+            self.manual_login()
+            retried, auth_failed = self._run_async(
+                self.scrape_all_async(query, target_results, batch_size, delay, concurrency, auth_failed)
+            )
+            pages.update(retried)
+            if auth_failed:
+                print(f"❌ {len(auth_failed)} batches siguen sin autorización tras reautenticar")
 
-        # Inicializar variables de control
+        # Procesar en orden de offset para conservar el orden de relevancia
         all_articles = []
-        offset = 0
-        consecutive_errors = 0
-        max_consecutive_errors = 3
+        seen: set = set()
+        for offset in sorted(pages):
+            all_articles.extend(_dedupe_articles(pages[offset], seen))
+
+        duplicates = sum(len(page) for page in pages.values()) - len(all_articles)
+        if duplicates:
+            print(f"♻️ {duplicates:,} artículos duplicados entre páginas descartados")
+        print(f"🎉 Scraping completado: {len(all_articles):,} artículos obtenidos")
+        return all_articles
+
+    def scrape_all_to_csv(
+        self,
+        query: str,
+        filename: str,
+        max_results: Optional[int] = None,
+        batch_size: int = 50,
+        delay: float = 0.0,
+        concurrency: int = 10,
+    ) -> Optional[str]:
+        """
+        Realiza el scraping escribiendo cada batch al CSV en cuanto llega.
+        
+        Variante de scrape_all() + save_to_csv() que no acumula todos los
+        artículos en memoria: cada página se escribe en el CSV en
+        cuanto se extrae, así que el consumo de RAM queda en
+        O(concurrency × batch_size) en lugar de crecer con el total de resultados.
+        
+        Args:
+            query (str): Término de búsqueda.
+            filename (str): Archivo CSV de salida. Si es solo un nombre, se
+                guarda en data/csv/<filename> (igual que save_to_csv()).
+            max_results (Optional[int], optional): Máximo de resultados.
+                Por defecto None (todos).
+            batch_size (int, optional): Resultados por petición. Por defecto 50.
+            delay (float, optional): Si es > 0, como máximo una petición cada
+                `delay` segundos. Por defecto 0.0 (solo rate_limit_rps).
+            concurrency (int, optional): Máximo de peticiones simultáneas.
+                Por defecto 10.
+        
+        Returns:
+            Optional[str]: Ruta completa del CSV generado, o None si no se
+                obtuvo ningún artículo.
+        
+        Note:
+            - Mismas columnas (orden alfabético) y limpieza de saltos de línea
+              que save_to_csv()
+            - Las filas quedan en orden de llegada de cada batch, no en orden
+              de relevancia (usar scrape_all() si el orden importa)
+        
+        Example:
+            >>> path = scraper.scrape_all_to_csv("deep learning", "dl.csv", max_results=5000)
+            >>> df = pd.read_csv(path)
+        """
+        target_results = self._prepare_scrape(query, max_results)
+        if target_results == 0:
+            return None
 
-        # Loop principal de scraping
-        while len(all_articles) < target_results and consecutive_errors < max_consecutive_errors:
-            # Calcular cuántos resultados quedan por obtener
-            remaining = target_results - len(all_articles)
-            current_batch_size = min(batch_size, remaining)
+        fullpath = self._resolve_output_path(filename, os.path.join("data", "csv"))
+        fieldnames = sorted(_ARTICLE_COLS)
+        written = 0
+        seen: set = set()
 
-            print(f"📡 Scraping offset {offset:,} - {offset + current_batch_size:,} "
-                  f"({len(all_articles):,}/{target_results:,} completado)")
+        offsets = list(range(0, target_results, batch_size))
+        print(f"📡 Descargando {len(offsets):,} batches hacia {fullpath} (concurrencia {concurrency})...")
 
-            try:
-                # Realizar búsqueda para el batch actual
-                data = self.search(query, offset, current_batch_size, verbose=True)
-                articles = self.extract_articles(data)
-
-                if not articles:
-                    print("❌ No se encontraron más artículos")
-                    break
-
-                # Agregar artículos a la lista completa
-                all_articles.extend(articles)
-                offset += current_batch_size
-                consecutive_errors = 0  # Reset del contador de errores
-
-                # Rate limiting con variación aleatoria para parecer humano
-                if len(all_articles) < target_results:
-                    sleep_time = delay + random.uniform(0, 1)
-                    print(f"⏸️ Esperando {sleep_time:.1f} segundos...")
-                    time.sleep(sleep_time)
-
-            except requests.exceptions.RequestException as e:
-                # Manejo de errores de red
-                consecutive_errors += 1
-                print(f"❌ Error de red ({consecutive_errors}/{max_consecutive_errors}): {e}")
-                
-                # Verificar si es error de autenticación
-                if "401" in str(e) or "403" in str(e):
-                    print("🔑 Error de autenticación. Reautenticando...")
-                    self.manual_login()
-                    consecutive_errors = 0  # Reset después de reautenticar
-                    continue
-                
-                # Backoff exponencial: esperar más tiempo con cada error
-                wait_time = 5 * consecutive_errors
-                print(f"⏳ Esperando {wait_time} segundos antes de reintentar...")
-                time.sleep(wait_time)
-                
-            except Exception as e:
-                # Manejo de errores inesperados
-                consecutive_errors += 1
-                print(f"❌ Error inesperado ({consecutive_errors}/{max_consecutive_errors}): {e}")
-                time.sleep(5)
+        with open(fullpath, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as csvfile:
+            csvfile.write(",".join(fieldnames) + "\r\n")
 
-        print(f"🎉 Scraping completado: {len(all_articles):,} artículos obtenidos")
-        return all_articles
+            def append_page(offset: int, articles: List[Dict]):
+                nonlocal written
+                written += self._write_csv_rows(csvfile, _dedupe_articles(articles, seen), fieldnames)
+
+            _, auth_failed = self._run_async(
+                self.scrape_all_async(
+                    query, target_results, batch_size, delay, concurrency, offsets, on_page=append_page
+                )
+            )
+
+            if auth_failed:
+                print(f"🔑 Error de autenticación en {len(auth_failed)} batches. Reautenticando...")
+                self.manual_login()
+                _, auth_failed = self._run_async(
+                    self.scrape_all_async(
+                        query, target_results, batch_size, delay, concurrency, auth_failed, on_page=append_page
+                    )
+                )
+                if auth_failed:
+                    print(f"❌ {len(auth_failed)} batches siguen sin autorización tras reautenticar")
+
+        if not written:
+            print("❌ No se obtuvo ningún artículo")
+            os.remove(fullpath)
+            return None
+
+        print(f"🎉 Scraping completado: {written:,} artículos guardados en {fullpath}")
+        return fullpath
+
+    def iter_pages(
+        self,
+        query: str,
+        max_results: Optional[int] = None,
+        batch_size: int = 50,
+    ) -> Iterator[List[Dict]]:
+        """
+        Recorre la búsqueda página a página, descargando la siguiente por adelantado.
+        
+        Alternativa síncrona y secuencial a scrape_all() para quien quiere
+        procesar cada página a medida que llega (sin asyncio). Mientras el
+        llamador procesa la página actual, la siguiente ya se está
+        descargando en un hilo, así que la latencia de red queda oculta tras
+        el trabajo de extracción/escritura.
+        
+        Args:
+            query (str): Término de búsqueda.
+            max_results (Optional[int], optional): Máximo de resultados.
+                Por defecto None (todos).
+            batch_size (int, optional): Resultados por petición. Por defecto 50.
+        
+        Yields:
+            List[Dict]: Artículos de cada página, en orden de relevancia.
+        
+        Raises:
+            requests.exceptions.HTTPError: Si una petición falla tras los
+                reintentos de la sesión.
+        
+        Example:
+            >>> for page in scraper.iter_pages("robotics", max_results=500):
+            ...     scraper.save_to_csv_streaming(page, "robotics_parcial.csv")
+        """
+        target_results = self._prepare_scrape(query, max_results)
+        if target_results == 0:
+            return
+
+        offsets = range(0, target_results, batch_size)
+
+        def fetch(offset: int) -> Dict:
+            return self.search(query, offset, min(batch_size, target_results - offset), verbose=False)
 
-    def save_to_csv(self, articles: List[Dict], filename: str):
+        seen: set = set()
+
+        # Un solo hilo basta: siempre hay como mucho una página en vuelo
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_future = executor.submit(fetch, offsets[0])
+            for next_offset in [*offsets[1:], None]:
+                data = next_future.result()
+                if next_offset is not None:
+                    next_future = executor.submit(fetch, next_offset)
+                yield _dedupe_articles(self.iter_articles(data), seen)
+
+    def _resolve_output_path(self, filename: str, default_dir: str) -> str:
+        """
+        Resuelve la ruta de salida de un archivo exportado.
+        
+        Si el usuario solo pasa un nombre de archivo, se guarda en
+        default_dir/<filename> para mantener el directorio raíz limpio. Si
+        pasa una ruta, se respeta (creando la carpeta si es necesaria).
+        """
+        if not os.path.dirname(filename):
+            os.makedirs(default_dir, exist_ok=True)
+            return os.path.join(default_dir, filename)
+
+        parent = os.path.dirname(filename)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        return filename
+
+    def _write_csv_rows(self, csvfile, articles: Iterable[Dict], columns: List[str]) -> int:
+        """
+        Escribe artículos en bloques de _CSV_FLUSH_ROWS filas por write().
+        
+        Unir las filas antes de escribir amortiza el coste de codificación y
+        de llamadas al buffer del archivo frente a escribir fila por fila.
+        Cada fila se formatea con la función generada por _row_formatter():
+        valores como string, saltos de línea aplanados y comillas solo donde
+        hacen falta (mismo resultado que csv.writer con QUOTE_MINIMAL).
+        
+        Returns:
+            int: Número de filas escritas.
+        """
+        fmt = _row_formatter(tuple(columns))
+        iterator = iter(articles)
+        written = 0
+        while True:
+            block = list(map(fmt, islice(iterator, _CSV_FLUSH_ROWS)))
+            if not block:
+                return written
+            csvfile.write("".join(block))
+            written += len(block)
+
+    def save_to_csv(self, articles: List[Dict], filename: str, compress: bool = False):
         """
         Guarda los artículos extraídos en un archivo CSV.
         
@@ -1224,6 +2237,10 @@ class EBSCOScraper:
                 o extract_articles().
             filename (str): Ruta y nombre del archivo CSV a crear.
                 Si no incluye extensión .csv, se recomienda agregarla.
+            compress (bool, optional): Si es True, escribe <filename>.gz con
+                GZIP (en paralelo con mgzip si está instalado). Útil cuando el
+                cuello de botella es el almacenamiento o la transferencia del
+                archivo. Por defecto False.
         
         Features:
             - Detecta automáticamente todas las columnas presentes
@@ -1271,46 +2288,280 @@ class EBSCOScraper:
         if not articles:
             print("❌ No hay artículos para guardar")
             return
-            
-        # Obtener todas las columnas únicas de todos los artículos
-        all_columns = set()
+
+        # Preparar ruta: si el usuario solo pasa un nombre de archivo, guardarlo
+        # en data/csv/<filename> para mantener el directorio raíz limpio.
+        fullpath = self._resolve_output_path(filename, os.path.join("data", "csv"))
+        if compress and not fullpath.endswith(".gz"):
+            fullpath += ".gz"
+
+        if pa is not None and len(articles) > _ARROW_CSV_MIN_ROWS:
+            n_columns = self._save_csv_arrow(articles, fullpath, compress)
+            print(f"Datos guardados en CSV: {fullpath}")
+            print(f"Total de registros: {len(articles)}")
+            print(f"Columnas incluidas: {n_columns}")
+            return
+
+        # Una sola pasada: se descubren las columnas a medida que aparecen y
+        # cada valor se formatea en su posición (índice de descubrimiento)
+        columns: List[str] = []
+        col_index: Dict[str, int] = {}
+        rows: List[List[str]] = []
         for article in articles:
-            all_columns.update(article.keys())
+            row = [""] * len(columns)
+            for key, value in article.items():
+                idx = col_index.get(key)
+                if idx is None:
+                    idx = col_index[key] = len(columns)
+                    columns.append(key)
+                    row.append("")
+                row[idx] = _csv_field(value)
+            rows.append(row)
+
+        # Ordenar columnas alfabéticamente para consistencia (las filas
+        # anteriores a la aparición de una columna se rellenan con "")
+        order = sorted(range(len(columns)), key=columns.__getitem__)
+        ordered_columns = [columns[i] for i in order]
+        n_columns = len(columns)
+
+        def blocks() -> Iterator[str]:
+            yield ",".join(ordered_columns) + "\r\n"
+            for start in range(0, len(rows), _CSV_FLUSH_ROWS):
+                block = []
+                for row in rows[start:start + _CSV_FLUSH_ROWS]:
+                    if len(row) < n_columns:
+                        row.extend([""] * (n_columns - len(row)))
+                    block.append(",".join([row[i] for i in order]) + "\r\n")
+                yield "".join(block)
+
+        # Escribir archivo CSV
+        if compress:
+            with self._open_csv(fullpath, compress) as csvfile:
+                for text in blocks():
+                    csvfile.write(text)
+        else:
+            self._write_csv_raw(fullpath, blocks())
+
+        print(f"Datos guardados en CSV: {fullpath}")
+        print(f"Total de registros: {len(articles)}")
+        print(f"Columnas incluidas: {len(ordered_columns)}")
+
+    def _write_csv_raw(self, fullpath: str, text_blocks: Iterable[str]):
+        """
+        Escribe bloques de texto CSV directamente sobre el descriptor de archivo.
+        
+        Cada bloque se codifica a UTF-8 una sola vez y se acumula en un
+        bytearray que se vuelca con os.write() al llegar a _CSV_BUFFER_SIZE,
+        sin pasar por la capa TextIOWrapper (codificación y traducción de
+        saltos de línea por cada write()).
+        """
+        fd = os.open(fullpath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            buf = bytearray()
+            for text in text_blocks:
+                buf += text.encode("utf-8")
+                if len(buf) >= _CSV_BUFFER_SIZE:
+                    _write_all(fd, buf)
+                    buf.clear()
+            _write_all(fd, buf)
+        finally:
+            os.close(fd)
+
+    def _open_csv(self, fullpath: str, compress: bool = False):
+        """
+        Abre un CSV de salida en modo texto, opcionalmente comprimido con GZIP.
         
-        # Ordenar columnas alfabéticamente para consistencia
-        ordered_columns = sorted(all_columns)
+        Con compress=True usa mgzip (DEFLATE en varios hilos) si está
+        instalado, y si no el módulo gzip estándar. En ambos casos el
+        resultado es un .gz normal que cualquier lector de gzip abre.
+        """
+        if not compress:
+            return open(fullpath, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE)
+        if mgzip is not None:
+            return mgzip.open(
+                fullpath, 'wt', encoding='utf-8', newline='',
+                thread=os.cpu_count(), blocksize=_GZIP_BLOCK_SIZE,
+            )
+        return gzip.open(fullpath, 'wt', encoding='utf-8', newline='')
+
+    def _save_csv_arrow(self, articles: List[Dict], fullpath: str, compress: bool = False) -> int:
+        """
+        Escribe el CSV con pyarrow.csv.write_csv (codificación en C).
         
-        # Preparar ruta: si el usuario solo pasa un nombre de archivo, guardarlo
-        # en data/csv/<filename> para mantener el directorio raíz limpio.
-        if not os.path.dirname(filename):
-            csv_dir = os.path.join("data", "csv")
-            os.makedirs(csv_dir, exist_ok=True)
-            fullpath = os.path.join(csv_dir, filename)
+        Usado por save_to_csv() para listas grandes. Mismas columnas (orden
+        alfabético) y limpieza de saltos de línea; la diferencia es de
+        formato: Arrow entrecomilla todos los campos de texto, lo que no
+        cambia el resultado al leerlo con pandas, Excel, etc.
+        
+        Returns:
+            int: Número de columnas escritas.
+        """
+        ordered_columns = sorted(set().union(*map(dict.keys, articles)))
+        table = pa.table({
+            col: pa_compute.replace_substring_regex(
+                pa.array([str(article.get(col, "")) for article in articles], type=pa.string()),
+                pattern=r"[\r\n]", replacement=" ",
+            )
+            for col in ordered_columns
+        })
+        write_options = pa_csv.WriteOptions(include_header=True, eol="\r\n")
+        if compress:
+            with pa.CompressedOutputStream(fullpath, "gzip") as stream:
+                pa_csv.write_csv(table, stream, write_options=write_options)
         else:
-            fullpath = filename
-            parent = os.path.dirname(fullpath)
-            if parent:
-                os.makedirs(parent, exist_ok=True)
+            pa_csv.write_csv(table, fullpath, write_options=write_options)
+        return len(ordered_columns)
 
-        # Escribir archivo CSV
-        with open(fullpath, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=ordered_columns)
-            writer.writeheader()
+    def save_to_csv_sharded(
+        self,
+        articles: List[Dict],
+        prefix: str,
+        shard_rows: int = 200_000,
+    ) -> List[str]:
+        """
+        Guarda los artículos en varios CSV de shard_rows filas, en paralelo.
+        
+        Cada fragmento se formatea y escribe en un proceso distinto
+        (ProcessPoolExecutor), así que el coste de CPU del formateo se
+        reparte entre núcleos. Todos los archivos tienen cabecera y las mismas
+        columnas, de modo que pueden leerse por separado o en paralelo.
+        
+        Args:
+            articles (List[Dict]): Lista de artículos obtenida de scrape_all().
+            prefix (str): Prefijo de los archivos: <prefix>_000.csv,
+                <prefix>_001.csv, ... (en data/csv/ si es solo un nombre).
+            shard_rows (int, optional): Filas por archivo. Por defecto 200_000.
+        
+        Returns:
+            List[str]: Rutas de los archivos generados, en orden.
+        
+        Example:
+            >>> paths = scraper.save_to_csv_sharded(articles, "ia_salud", shard_rows=50_000)
+            >>> df = pd.concat(pd.read_csv(p) for p in paths)
+        """
+        if not articles:
+            print("❌ No hay artículos para guardar")
+            return []
+
+        base = self._resolve_output_path(prefix, os.path.join("data", "csv"))
+        if base.endswith(".csv"):
+            base = base[:-4]
+        columns = sorted(set().union(*map(dict.keys, articles)))
+
+        chunks = [articles[i:i + shard_rows] for i in range(0, len(articles), shard_rows)]
+        paths = [f"{base}_{i:03d}.csv" for i in range(len(chunks))]
+
+        if len(chunks) == 1:
+            _write_csv_shard(chunks[0], paths[0], columns)
+        else:
+            with ProcessPoolExecutor(max_workers=min(len(chunks), os.cpu_count() or 1)) as executor:
+                futures = [
+                    executor.submit(_write_csv_shard, chunk, path, columns)
+                    for chunk, path in zip(chunks, paths)
+                ]
+                wait(futures)
+                for future in futures:
+                    future.result()  # propagar errores de escritura
+
+        print(f"Datos guardados en {len(paths)} CSV: {base}_*.csv")
+        print(f"Total de registros: {len(articles)}")
+        return paths
 
-            for article in articles:
-                # Limpiar cada valor para evitar errores en CSV
-                clean_article = {}
-                for col in ordered_columns:
-                    value = article.get(col, "")
-                    # Convertir a string y eliminar caracteres problemáticos
-                    clean_value = str(value).replace('\n', ' ').replace('\r', ' ')
-                    clean_article[col] = clean_value
+    def save_to_csv_streaming(
+        self,
+        articles_iter: Iterable[Dict],
+        filename: str,
+        fieldnames: Optional[List[str]] = None,
+    ) -> int:
+        """
+        Guarda artículos en CSV consumiéndolos de un iterable, sin listarlos.
+        
+        A diferencia de save_to_csv(), no necesita una pasada previa para
+        descubrir las columnas: usa el esquema fijo de extracción, así que
+        acepta generadores (p. ej. iter_articles()) y el consumo de memoria no
+        depende del número de artículos.
+        
+        Args:
+            articles_iter (Iterable[Dict]): Artículos a escribir.
+            filename (str): Archivo CSV de salida (data/csv/ si es solo un nombre).
+            fieldnames (Optional[List[str]], optional): Columnas del CSV. Por
+                defecto las de extracción en orden alfabético (como save_to_csv()).
+                Las claves que no estén en fieldnames se ignoran.
+        
+        Returns:
+            int: Número de registros escritos.
+        
+        Example:
+            >>> data = scraper.search("machine learning", count=50)
+            >>> scraper.save_to_csv_streaming(scraper.iter_articles(data), "ml.csv")
+        """
+        columns = fieldnames or sorted(_ARTICLE_COLS)
+        fullpath = self._resolve_output_path(filename, os.path.join("data", "csv"))
 
-                writer.writerow(clean_article)
+        with open(fullpath, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as csvfile:
+            csvfile.write(",".join(columns) + "\r\n")
+            written = self._write_csv_rows(csvfile, articles_iter, columns)
 
         print(f"Datos guardados en CSV: {fullpath}")
+        print(f"Total de registros: {written}")
+        return written
+
+    def to_dataframe(self, articles: List[Dict]) -> pd.DataFrame:
+        """
+        Convierte la lista de artículos en un DataFrame con tipos explícitos.
+        
+        Usa DataFrame.from_records con la lista fija de columnas, así pandas no
+        tiene que inferir el esquema desde cada diccionario. Las columnas de
+        texto se convierten a string (Arrow si pyarrow está instalado) y
+        peer_reviewed a bool, lo que reduce memoria y acelera filtros/groupby.
+        
+        Args:
+            articles (List[Dict]): Artículos de scrape_all() o extract_articles().
+        
+        Returns:
+            pd.DataFrame: Una fila por artículo con las columnas de _ARTICLE_COLS.
+        
+        Example:
+            >>> df = scraper.to_dataframe(articles)
+            >>> df[df["peer_reviewed"]].groupby("journal").size()
+        """
+        df = pd.DataFrame.from_records(articles, columns=_ARTICLE_COLS)
+        # from_records deja NaN donde faltó una clave; eq(True) lo trata como False
+        df["peer_reviewed"] = df["peer_reviewed"].eq(True)
+        return df.astype({col: _STRING_DTYPE for col in _ARTICLE_COLS if col != "peer_reviewed"})
+
+    def save_to_parquet(self, articles: List[Dict], filename: str) -> Optional[str]:
+        """
+        Guarda los artículos en formato Parquet comprimido con zstd.
+        
+        Parquet conserva los tipos de to_dataframe(), ocupa bastante menos que
+        el CSV y se recarga mucho más rápido con pd.read_parquet().
+        
+        Args:
+            articles (List[Dict]): Artículos a guardar.
+            filename (str): Archivo de salida. Si es solo un nombre, se guarda
+                en data/parquet/<filename>.
+        
+        Returns:
+            Optional[str]: Ruta del archivo generado, o None si no se pudo guardar.
+        
+        Note:
+            Requiere pyarrow (dependencia opcional del proyecto).
+        """
+        if not articles:
+            print("❌ No hay artículos para guardar")
+            return None
+
+        fullpath = self._resolve_output_path(filename, os.path.join("data", "parquet"))
+        try:
+            self.to_dataframe(articles).to_parquet(fullpath, compression="zstd", index=False)
+        except ImportError as e:
+            print(f"❌ No se pudo guardar Parquet (instala pyarrow): {e}")
+            return None
+
+        print(f"Datos guardados en Parquet: {fullpath}")
         print(f"Total de registros: {len(articles)}")
-        print(f"Columnas incluidas: {len(ordered_columns)}")
+        return fullpath
 
     def save_to_json(self, articles: List[Dict], filename: str):
         """
@@ -1378,18 +2629,11 @@ class EBSCOScraper:
             es más eficiente en espacio y puede cargarse parcialmente.
         """
         # Guardar JSON en data/json si no se especifica ruta
-        if not os.path.dirname(filename):
-            json_dir = os.path.join("data", "json")
-            os.makedirs(json_dir, exist_ok=True)
-            fullpath = os.path.join(json_dir, filename)
-        else:
-            fullpath = filename
-            parent = os.path.dirname(fullpath)
-            if parent:
-                os.makedirs(parent, exist_ok=True)
+        fullpath = self._resolve_output_path(filename, os.path.join("data", "json"))
 
-        with open(fullpath, "w", encoding="utf-8") as f:
-            json.dump(articles, f, indent=2, ensure_ascii=False)
+        # orjson escribe UTF-8 directamente (equivalente a ensure_ascii=False)
+        with open(fullpath, "wb") as f:
+            f.write(orjson.dumps(articles, option=orjson.OPT_INDENT_2))
         print(f"Datos guardados en JSON: {fullpath}")
 
 
@@ -29,7 +29,7 @@ Workflow Típico:
 ----------------
 1. Cargar datos desde CSV
 2. Limpiar texto y normalizar campos
-3. Identificar duplicados usando hash MD5
+3. Identificar duplicados agrupando por clave normalizada
 4. Eliminar duplicados manteniendo el primer registro de cada grupo
 5. Generar reportes y exportar resultados
 
@@ -38,12 +38,292 @@ Fecha: 2025
 Licencia: [Tu licencia]
 """
 
+import numpy as np
 import pandas as pd
 import re
-from typing import List, Dict, Tuple, Optional, Any
-import hashlib
+from typing import List, Dict, Tuple, Optional, Any, Callable, Deque, IO, Union
 from datetime import datetime
 import os
+import io
+import sys
+import gc
+import logging
+import hashlib
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+
+# Progreso por paso de la limpieza (una línea por evento, sin emojis); los
+# resúmenes de inicio/fin siguen en stdout (se omiten con verbose=False)
+logger = logging.getLogger(__name__)
+
+# Expresiones de clean_text() y normalize_title(), compiladas una sola vez
+_CTRL_RE = re.compile(r'[\r\n\t]+')
+_WS_RE = re.compile(r'\s+')
+_NONWORD_RE = re.compile(r'[^\w\s]')
+
+# Mismos caracteres que \s de re (espacios Unicode incluidos) como clase
+# explícita, válida igual en re y en RE2: con string[pyarrow] el reemplazo
+# lo ejecuta el kernel regex de Arrow en C++ (sin GIL) con el mismo
+# resultado que _WS_RE. Solo coinciden los tramos que cambian (dos o más
+# espacios, o algún otro blanco); los espacios simples, la inmensa mayoría
+# en abstracts, ni se reemplazan
+_WS_CHARS = '\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+_WS_PATTERN = f' [{_WS_CHARS}]+|[{_WS_CHARS.replace(" ", "")}][{_WS_CHARS}]*'
+
+# Columnas con muchos valores repetidos en exportaciones EBSCO: se cargan
+# como 'category' (códigos enteros + diccionario de niveles)
+_CATEGORY_COLUMNS = ('doi', 'authors', 'journal', 'subjects')
+
+# Filas por bloque en clean_data_streaming()
+_STREAM_CHUNK_ROWS = 100_000
+
+# Filas por row group al escribir Parquet (objetivo por defecto de pyarrow)
+_PARQUET_BATCH_ROWS = 65_536
+
+# pyarrow es opcional: sin él, clean_data_streaming() escribe CSV y
+# load_data() usa el parser C de pandas
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pa_parquet
+    import pyarrow.csv as pa_csv
+    _CSV_ENGINE = 'pyarrow'
+    _STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    pa = None
+    _CSV_ENGINE = 'c'
+    _STRING_DTYPE = 'string'
+
+# Tipos de lectura en load_data(): las columnas repetitivas como categorías
+# (la normalización posterior trabaja sobre los niveles y no sobre cada fila)
+# y el texto libre como cadenas Arrow. Las columnas ausentes se ignoran
+_READ_DTYPES: Dict[str, Any] = {col: 'category' for col in _CATEGORY_COLUMNS}
+_READ_DTYPES.update(title=_STRING_DTYPE, abstract=_STRING_DTYPE)
+
+# Columnas de texto que limpian clean_data() y clean_data_streaming()
+_TEXT_COLUMNS = ('title', 'abstract', 'authors', 'journal', 'subjects')
+
+# Versión del resultado de clean_data() guardado en caché: subirla cuando
+# cambien los criterios de limpieza para invalidar las entradas anteriores
+_CACHE_VERSION = 1
+
+# Tamaño de lectura al calcular el hash del archivo de entrada (sin
+# hashlib.file_digest, Python < 3.11)
+_HASH_BLOCK_SIZE = 1 << 20
+
+# Títulos normalizados que recuerda normalize_title()
+_TITLE_CACHE_SIZE = 1 << 16
+
+# Mensaje de removal_info para un duplicado: (razón, índice conservado)
+_DUPLICATE_MESSAGE = "ELIMINADO - %s: Duplicado del índice %d"
+
+# Estado de cada registro (clave de partición de _COMPLETO con
+# partition_full=True); valores ASCII para los nombres de directorio
+_REMOVAL_STATUS = {
+    'CONSERVADO': 'CONSERVADO',
+    'ELIMINADO - TÍTULO VACÍO': 'TITULO_VACIO',
+}
+_REMOVAL_STATUS_DEFAULT = 'DUPLICADO'
+
+# numba es opcional: acelera normalize_title() cuando se llama fila a fila
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _map_categories(series: pd.Series, func: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """
+    Aplica una transformación de texto a una columna categórica nivel a nivel.
+    
+    func se ejecuta una sola vez sobre los niveles (más NaN, que lo
+    representa el código -1) y el resultado se reparte a las filas por su
+    código. Niveles que quedan iguales tras la transformación se fusionan.
+    
+    Args:
+        series (pd.Series): Columna con dtype 'category'.
+        func (Callable): Transformación vectorizada Serie → Serie.
+    
+    Returns:
+        pd.Series: Columna categórica con el mismo índice y nombre.
+    """
+    levels = pd.Series(list(series.cat.categories) + [np.nan], dtype=object)
+    mapped = func(levels).to_numpy()
+    # El código -1 (NaN) indexa el último elemento de levels
+    new_codes, new_levels = pd.factorize(mapped)
+    codes = new_codes[series.cat.codes.to_numpy()]
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=new_levels),
+        index=series.index,
+        name=series.name,
+    )
+
+
+class _NonWordTable(dict):
+    """
+    Tabla de str.translate que borra lo que _NONWORD_RE borraría.
+    
+    Se rellena bajo demanda: cada código Unicode se clasifica la primera
+    vez que aparece (isalnum(), '_' o isspace() se conservan) y las
+    siguientes búsquedas son un acceso al dict.
+    """
+
+    def __missing__(self, code: int) -> Optional[int]:
+        char = chr(code)
+        value = code if (char.isalnum() or char == '_' or char.isspace()) else None
+        self[code] = value
+        return value
+
+
+_NONWORD_TABLE = _NonWordTable()
+
+
+def _normalize_title_chars(title: str) -> str:
+    """
+    normalize_title() en una sola pasada carácter a carácter, sin regex.
+    
+    Conserva lo que acepta \\w (isalnum() o '_'), descarta el resto de
+    símbolos y convierte cada racha de espacios (isspace()) en uno solo,
+    sin espacios al inicio ni al final. Con numba se compila a código
+    nativo (_normalize_title_nb).
+    """
+    out = []
+    pending_space = False
+    for c in title.lower():
+        if c.isalnum() or c == '_':
+            if pending_space and len(out) > 0:
+                out.append(' ')
+            pending_space = False
+            out.append(c)
+        elif c.isspace():
+            pending_space = True
+    return ''.join(out)
+
+
+_normalize_title_nb = njit(cache=True)(_normalize_title_chars) if njit is not None else None
+
+
+def _has_repeated_codes(codes: np.ndarray) -> bool:
+    """
+    True si algún código de grupo se repite.
+    
+    Los códigos de _duplicate_key_codes() son 0..G-1 sin huecos, así que
+    todos son distintos si y solo si G == len(codes): basta el máximo, sin
+    tabla hash (mismo atajo que Index.is_unique en duplicated()).
+    """
+    return codes.size > 0 and int(codes.max()) + 1 < codes.size
+
+
+def _duplicate_info_frame(removed_index, kept_index, kept_titles) -> pd.DataFrame:
+    """
+    Construye duplicate_info en columnas: una fila por registro eliminado.
+    
+    Args:
+        removed_index: Índices de los registros eliminados (índice del frame).
+        kept_index: Índice del registro conservado de cada eliminado.
+        kept_titles: Título conservado (truncado) de cada eliminado.
+    
+    Returns:
+        pd.DataFrame: Índice 'removed_index' y columnas kept_index,
+            duplicate_of_title y reason ('DUPLICADO', categórica).
+    """
+    return pd.DataFrame(
+        {
+            'kept_index': np.asarray(kept_index, dtype=np.int64),
+            'duplicate_of_title': np.asarray(kept_titles, dtype=object),
+            'reason': pd.Categorical.from_codes(np.zeros(len(kept_index), dtype=np.int8), ['DUPLICADO']),
+        },
+        index=pd.Index(np.asarray(removed_index, dtype=np.int64), name='removed_index'),
+    )
+
+
+def _write_parquet(
+    df: pd.DataFrame,
+    path: str,
+    compression: str = 'snappy',
+    batch_rows: int = _PARQUET_BATCH_ROWS,
+    n_jobs: Optional[int] = None,
+) -> None:
+    """
+    Escribe df en Parquet por bloques de batch_rows filas (un row group cada uno).
+    
+    A diferencia de un único to_parquet, solo unos pocos bloques están
+    convertidos a Arrow a la vez, así que la memoria extra queda acotada y
+    la compresión avanza bloque a bloque. El esquema (con los metadatos de
+    pandas, para recuperar los dtypes con read_parquet) se fija a partir del
+    DataFrame completo.
+    
+    Con n_jobs > 1, hasta n_jobs bloques se convierten en paralelo en hilos
+    mientras el writer codifica y comprime el anterior (pyarrow libera el
+    GIL); los row groups se escriben siempre en el orden original.
+    Por defecto n_jobs = os.cpu_count().
+    """
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    starts = range(0, max(len(df), 1), batch_rows)
+
+    def to_table(start: int) -> 'pa.Table':
+        chunk = df.iloc[start:start + batch_rows]
+        return pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+
+    workers = min(n_jobs or os.cpu_count() or 1, len(starts))
+    with pa_parquet.ParquetWriter(path, schema, compression=compression) as writer:
+        if workers <= 1:
+            for start in starts:
+                writer.write_table(to_table(start))
+            return
+
+        # Ventana de n_jobs bloques en vuelo: paralelo sin cargar todo en memoria
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending: Deque = deque()
+            for start in starts:
+                pending.append(pool.submit(to_table, start))
+                if len(pending) >= workers:
+                    writer.write_table(pending.popleft().result())
+            while pending:
+                writer.write_table(pending.popleft().result())
+
+
+def _write_parquet_dataset(df: pd.DataFrame, path: str, compression: str = 'snappy') -> None:
+    """
+    Escribe df con removal_info como dataset Parquet particionado por estado.
+    
+    Añade la columna removal_status (ver _REMOVAL_STATUS), derivada nivel a
+    nivel de la categórica removal_info, y escribe un directorio
+    removal_status=<estado> por valor bajo path. Un dataset previo en path
+    se reemplaza partición a partición.
+    """
+    status = _map_categories(
+        df['removal_info'],
+        lambda levels: levels.map(lambda v: _REMOVAL_STATUS.get(v, _REMOVAL_STATUS_DEFAULT)),
+    )
+    # append_column en vez de df.assign: no copia el resto de columnas
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.append_column('removal_status', pa.array(status))
+    pa_parquet.write_to_dataset(
+        table,
+        root_path=path,
+        partition_cols=['removal_status'],
+        compression=compression,
+        existing_data_behavior='delete_matching',
+    )
+
+
+def _write_csv(df: pd.DataFrame, path: str, writer: str = 'pandas') -> None:
+    """
+    Escribe df en CSV (UTF-8, sin índice) con el writer indicado.
+    
+    'pandas' usa DataFrame.to_csv. 'pyarrow' usa el writer C++ de Arrow
+    (multihilo, columnar y sin GIL), varias veces más rápido en tablas
+    grandes, aunque el texto no es idéntico: entrecomilla todas las
+    cadenas, escribe true/false y los float enteros sin '.0'. read_csv
+    recupera los mismos valores de ambos.
+    """
+    if writer == 'pyarrow':
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pa_csv.write_csv(table, path, write_options=pa_csv.WriteOptions(include_header=True))
+    else:
+        df.to_csv(path, index=False, encoding='utf-8')
 
 
 class DataCleaner:
@@ -51,8 +331,8 @@ class DataCleaner:
     Clase principal para limpieza y deduplicación de datos de EBSCO.
     
     Esta clase implementa un pipeline completo de limpieza de datos que
-    procesa archivos CSV de EBSCO, elimina duplicados usando algoritmos
-    de hash, normaliza texto y genera reportes detallados.
+    procesa archivos CSV de EBSCO, elimina duplicados agrupando
+    por clave normalizada, normaliza texto y genera reportes detallados.
     
     La clase mantiene dos versiones del dataset:
     1. df_original: Dataset original sin modificar
@@ -65,9 +345,10 @@ class DataCleaner:
         input_file (str): Ruta al archivo CSV de entrada
         df_original (Optional[pd.DataFrame]): DataFrame con datos originales
         df_clean (Optional[pd.DataFrame]): DataFrame con datos limpios
-        duplicate_info (Dict[int, Dict[str, Any]]): Información sobre registros
-            duplicados eliminados. Key: índice del registro eliminado,
-            Value: dict con razón, índice conservado, etc.
+        duplicate_info (pd.DataFrame): Información sobre registros
+            duplicados eliminados, una fila por registro. Índice
+            'removed_index': índice del registro eliminado; columnas
+            kept_index, duplicate_of_title y reason.
         cleaning_stats (Dict[str, int]): Estadísticas del proceso de limpieza
             incluyendo conteos de registros originales, finales, eliminados.
     
@@ -86,7 +367,7 @@ class DataCleaner:
         mediante los métodos load_data() y clean_data() respectivamente.
     """
     
-    def __init__(self, input_file: str):
+    def __init__(self, input_file: str, cache_dir: Optional[str] = None):
         """
         Inicializa el limpiador de datos con un archivo CSV de entrada.
         
@@ -98,11 +379,15 @@ class DataCleaner:
             input_file (str): Ruta al archivo CSV que contiene los datos
                 de EBSCO a limpiar. Debe ser un CSV válido con encoding UTF-8
                 y debe incluir al menos la columna 'title'.
+            cache_dir (Optional[str], optional): Directorio donde guardar el
+                resultado de clean_data() indexado por el hash del contenido
+                de input_file (p. ej. ".dedup_cache"). Con None no se usa
+                caché. Requiere pyarrow (Parquet). Por defecto None.
         
         Initializes:
             - df_original: None (se carga con load_data())
             - df_clean: None (se genera con clean_data())
-            - duplicate_info: Diccionario vacío para metadata de duplicados
+            - duplicate_info: DataFrame vacío para metadata de duplicados
             - cleaning_stats: Diccionario con contadores en 0
         
         Note:
@@ -114,15 +399,25 @@ class DataCleaner:
             >>> # Ahora se debe llamar cleaner.load_data()
         """
         self.input_file = input_file
+        self.cache_dir = cache_dir
         
         # DataFrames principales (se inicializan como None hasta load_data / clean_data)
         self.df_original: Optional[pd.DataFrame] = None
         self.df_clean: Optional[pd.DataFrame] = None
         
-        # Diccionario de información de duplicados
-        # Key: índice del registro eliminado
-        # Value: diccionario con metadata (razón, índice conservado, título, etc.)
-        self.duplicate_info: Dict[int, Dict[str, Any]] = {}
+        # Información de duplicados en columnas (una fila por eliminado)
+        # Índice: índice del registro eliminado
+        # Columnas: índice conservado, título conservado y razón
+        self.duplicate_info: pd.DataFrame = _duplicate_info_frame([], [], [])
+        
+        # Último resultado de create_removal_info_column() y la pareja
+        # (df_original, duplicate_info) con la que se calculó
+        self._df_with_info: Optional[pd.DataFrame] = None
+        self._df_with_info_key: Optional[Tuple[int, int]] = None
+        
+        # Títulos vacíos de df_original (por posición) según clean_data(),
+        # reutilizados por create_removal_info_column()
+        self._empty_title_mask: Optional[np.ndarray] = None
         
         # Estadísticas de limpieza
         self.cleaning_stats: Dict[str, int] = {
@@ -133,7 +428,7 @@ class DataCleaner:
             'invalid_records_removed': 0      # Otros registros inválidos
         }
         
-    def load_data(self) -> bool:
+    def load_data(self, verbose: bool = True) -> bool:
         """
         Carga los datos desde el archivo CSV especificado en __init__.
         
@@ -141,6 +436,10 @@ class DataCleaner:
         resultado en df_original. También inicializa el contador de registros
         originales en las estadísticas de limpieza.
         
+        Args:
+            verbose (bool, optional): Si False, no imprime el mensaje de
+                éxito. Por defecto True.
+        
         Returns:
             bool: True si la carga fue exitosa, False si hubo algún error
                 (archivo no encontrado, formato inválido, encoding incorrecto, etc.)
@@ -148,11 +447,12 @@ class DataCleaner:
         Side Effects:
             - Popula self.df_original con el DataFrame cargado
             - Actualiza self.cleaning_stats['original_count']
-            - Imprime mensaje de éxito o error en consola
+            - Imprime el mensaje de éxito en consola (salvo verbose=False)
+            - Registra el error, si lo hay, con el logger del módulo ('limepza')
         
         Raises:
             No lanza excepciones - captura todos los errores y retorna False.
-            Los errores se imprimen en consola para debugging.
+            El error se registra con logger.error para debugging.
         
         Example:
             >>> cleaner = DataCleaner("articles.csv")
@@ -161,26 +461,44 @@ class DataCleaner:
             ...     print(f"Columnas: {cleaner.df_original.columns.tolist()}")
             ... else:
             ...     print("Error al cargar datos")
-            ✅ Datos cargados exitosamente: 1,234 registros
+            Datos cargados exitosamente: 1,234 registros
         
         Note:
+            Las columnas doi, authors, journal y subjects se cargan con dtype
+            'category' y el resto de columnas de texto como cadenas
+            ('string[pyarrow]' con pyarrow instalado, cuyo parser se usa
+            también: engine='pyarrow').
             Asume que el CSV usa encoding UTF-8. Si tu archivo usa otro
             encoding (ej: latin-1, iso-8859-1), modifica el parámetro encoding.
         """
         try:
             # Cargar CSV con pandas
-            self.df_original = pd.read_csv(self.input_file, encoding='utf-8')
+            # (tipos fijados para que el parser no los infiera columna a columna)
+            self._df_with_info = None
+            self._empty_title_mask = None
+            self.df_original = pd.read_csv(
+                self.input_file, encoding='utf-8', dtype=_READ_DTYPES, engine=_CSV_ENGINE
+            )
             
+            # Enteros (año, páginas, citas) al tipo más pequeño que los contiene
+            for col in self.df_original.select_dtypes('int64').columns:
+                self.df_original[col] = pd.to_numeric(self.df_original[col], downcast='integer')
+            # El resto del texto (id, publisher, volume...) también como
+            # cadenas Arrow: buffers contiguos en vez de un objeto por celda
+            for col in self.df_original.select_dtypes('object').columns:
+                self.df_original[col] = self.df_original[col].astype(_STRING_DTYPE)
+
             # Actualizar contador de registros originales
             self.cleaning_stats['original_count'] = len(self.df_original)
             
             # Mensaje de éxito con formato de miles
-            print(f"Datos cargados exitosamente: {len(self.df_original):,} registros")
+            if verbose:
+                print(f"Datos cargados exitosamente: {len(self.df_original):,} registros")
             return True
             
         except Exception as e:
             # Capturar cualquier error y mostrar mensaje
-            print(f"Error cargando el archivo: {e}")
+            logger.error("error cargando %s: %s", self.input_file, e)
             return False
     
     def clean_text(self, text: str) -> str:
@@ -238,17 +556,59 @@ class DataCleaner:
         text = str(text)
         
         # Eliminar caracteres de control (\\r, \\n, \\t) y reemplazar con espacio
-        text = re.sub(r'[\r\n\t]+', ' ', text)
+        text = _CTRL_RE.sub(' ', text)
         
         # Normalizar múltiples espacios a un solo espacio
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         
         # Eliminar espacios al inicio y final
         text = text.strip()
         
         return text
     
-    def normalize_title(self, title: str) -> str:
+    def _clean_text_series(self, series: pd.Series) -> pd.Series:
+        """
+        Aplica clean_text() a una columna completa con operaciones .str.
+        
+        Mismo resultado que series.apply(self.clean_text), pero el reemplazo
+        de espacios se ejecuta sobre toda la columna en lugar de entrar en
+        Python por cada celda. Como \\s ya incluye \\r, \\n y \\t, basta
+        una sola pasada de _WS_RE. Las columnas categóricas se limpian por
+        nivel (_map_categories) y siguen siendo categóricas.
+        
+        Con dtype string se usa _WS_PATTERN como cadena: pandas lo delega en
+        el kernel regex de Arrow, que además libera el GIL, de modo que los
+        hilos de _clean_text_columns() limpian title y abstract a la vez.
+        """
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return _map_categories(series, self._clean_text_series)
+        if isinstance(series.dtype, pd.StringDtype):
+            # Conserva el dtype string (Arrow) y su kernel regex
+            text = series.fillna('')
+            return text.str.replace(_WS_PATTERN, ' ', regex=True).str.strip()
+        text = series.where(series.notna(), '').astype(str)
+        return text.str.replace(_WS_RE, ' ', regex=True).str.strip()
+
+    def _clean_text_columns(self, df: pd.DataFrame) -> None:
+        """
+        Limpia en su sitio las columnas de _TEXT_COLUMNS presentes en df.
+        
+        Las columnas son independientes entre sí, así que cada una se limpia
+        en su propio hilo; se asignan al DataFrame en el orden de
+        _TEXT_COLUMNS.
+        """
+        columns = [col for col in _TEXT_COLUMNS if col in df.columns]
+        if not columns:
+            return
+        workers = min(len(columns), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            cleaned = list(pool.map(self._clean_text_series, (df[col] for col in columns)))
+        for col, series in zip(columns, cleaned):
+            df[col] = series
+
+    @staticmethod
+    @lru_cache(maxsize=_TITLE_CACHE_SIZE)
+    def normalize_title(title: str) -> str:
         """
         Normaliza títulos para comparación de duplicados.
         
@@ -295,6 +655,10 @@ class DataCleaner:
             - Comparación de títulos case-insensitive
             - Matching fuzzy de títulos similares
         
+        Performance:
+            Función pura memoizada (lru_cache): los títulos repetidos del
+            dataset se normalizan una sola vez.
+        
         Note:
             Esta normalización es MUY agresiva. Títulos genuinamente
             diferentes pero con palabras similares podrían colisionar.
@@ -304,49 +668,46 @@ class DataCleaner:
         if pd.isna(title) or title == "":
             return ""
         
+        # Camino compilado: minúsculas + filtro + espacios en una pasada
+        if _normalize_title_nb is not None:
+            return _normalize_title_nb(str(title))
+        
         # Convertir a string y luego a minúsculas
         normalized = str(title).lower()
         
         # Eliminar TODA la puntuación y caracteres especiales
-        # Mantener solo: letras, números, espacios
-        # [^\w\s] significa: todo lo que NO sea word character (letras, números, _) ni espacios
-        normalized = re.sub(r'[^\w\s]', '', normalized)
+        # Mantener solo: letras, números, espacios (lo mismo que [^\w\s],
+        # pero con una tabla de translate en lugar del motor de regex)
+        normalized = normalized.translate(_NONWORD_TABLE)
         
-        # Normalizar espacios múltiples a un solo espacio
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        # Normalizar espacios múltiples a uno solo y quitar los extremos
+        normalized = ' '.join(normalized.split())
         
         return normalized
     
     def create_duplicate_key(self, row: pd.Series) -> str:
         """
-        Crea una clave única (hash) para identificar registros duplicados.
+        Crea la clave que identifica registros duplicados.
         
-        Genera un hash MD5 basado en la combinación de título normalizado,
-        DOI y autores. Dos registros con el mismo hash se consideran duplicados.
+        Combina título normalizado, DOI y autores en una sola cadena. Dos
+        registros con la misma clave se consideran duplicados.
         
-        El hash permite comparaciones rápidas (O(1)) en lugar de comparaciones
-        string por string (O(n)) para cada par de registros.
+        La clave se usa directamente como clave de diccionario: el hash
+        nativo de str de Python da comparaciones O(1) sin el coste de un hash
+        criptográfico (MD5) ni de su representación hexadecimal.
         
         Args:
             row (pd.Series): Fila del DataFrame que representa un artículo.
                 Debe contener (idealmente) las columnas: 'title', 'doi', 'authors'
         
         Returns:
-            str: Hash MD5 de 32 caracteres hexadecimales que identifica
-                únicamente la combinación de título, DOI y autores.
+            str: Clave con formato "titulo|doi|autores" (valores normalizados).
         
         Algorithm:
             1. Normalizar título (minúsculas, sin puntuación)
             2. Normalizar DOI (minúsculas, sin espacios)
             3. Normalizar autores (minúsculas, sin espacios)
             4. Concatenar con pipe "|" como separador
-            5. Generar hash MD5 de la string concatenada
-        
-        Hash Collisions:
-            MD5 tiene probabilidad casi nula de colisión para este caso de uso.
-            Si dos registros diferentes generan el mismo hash (extremadamente
-            raro), se considerarían erróneamente duplicados. En la práctica,
-            esto no ocurre con datasets académicos.
         
         Example:
             >>> cleaner = DataCleaner("data.csv")
@@ -357,12 +718,10 @@ class DataCleaner:
             ... })
             >>> 
             >>> key1 = cleaner.create_duplicate_key(row1)
-            >>> print(len(key1))  # Hash MD5 es siempre 32 caracteres
-            32
-            >>> print(key1[:8])  # Primeros 8 caracteres
-            'a3f7b2c1'
+            >>> print(key1)
+            'machine learning an introduction|10.1234/ml.2023.001|john smith; jane doe'
             >>> 
-            >>> # Mismo contenido → mismo hash
+            >>> # Mismo contenido → misma clave
             >>> row2 = pd.Series({
             ...     'title': 'MACHINE LEARNING - AN INTRODUCTION!!!',
             ...     'doi': '10.1234/ml.2023.001',
@@ -372,14 +731,10 @@ class DataCleaner:
             >>> key1 == key2  # Son duplicados
             True
         
-        Performance:
-            Generación de hash es O(1) y muy rápida. Permite detectar
-            duplicados en datasets de millones de registros eficientemente.
-        
         Note:
             Si los campos title, doi o authors no existen en row, se usan
             strings vacíos. Registros sin información podrían generar
-            hashes similares erróneamente.
+            claves iguales erróneamente.
         """
         # Obtener y normalizar título
         title = self.normalize_title(row.get('title', ''))
@@ -392,19 +747,93 @@ class DataCleaner:
         
         # Crear string combinada usando pipe como separador
         # Formato: "titulo|doi|autores"
-        combined = f"{title}|{doi}|{authors}"
-        
-        # Generar hash MD5 (32 caracteres hexadecimales)
-        hash_object = hashlib.md5(combined.encode('utf-8'))
-        return hash_object.hexdigest()
+        return f"{title}|{doi}|{authors}"
     
+    def _duplicate_key_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Versión vectorizada de create_duplicate_key().
+        
+        Calcula para todo el DataFrame, columna a columna, las tres partes de
+        la clave "titulo|doi|autores" con las mismas normalizaciones que
+        create_duplicate_key(). Cada registro queda identificado por la tupla
+        de sus tres columnas: dos registros tienen la misma clave combinada
+        si y solo si coinciden en las tres partes.
+        
+        Args:
+            df (pd.DataFrame): DataFrame a analizar.
+        
+        Returns:
+            pd.DataFrame: Columnas 'title', 'doi' y 'authors' con el mismo
+                índice que df. Si doi/authors son categóricas, la parte es el
+                código entero del nivel normalizado en lugar de la cadena.
+        """
+        empty = pd.Series('', index=df.index, dtype=object)
+
+        # Título: igual que normalize_title() (NaN y "" → "")
+        def normalize_titles(values: pd.Series) -> pd.Series:
+            values = values.where(values.notna(), '').astype(str)
+            return (
+                values.str.lower()
+                .str.replace(_NONWORD_RE, '', regex=True)
+                .str.replace(_WS_RE, ' ', regex=True)
+                .str.strip()
+            )
+
+        if 'title' in df.columns:
+            # Cada título distinto se normaliza una sola vez (niveles de la
+            # categoría) y el resultado se reparte a las filas
+            titles = df['title']
+            if not isinstance(titles.dtype, pd.CategoricalDtype):
+                titles = titles.astype('category')
+            title = _map_categories(titles, normalize_titles).astype(object)
+        else:
+            title = empty
+
+        # DOI y autores: str(valor).lower().strip(), como en create_duplicate_key()
+        def normalize(values: pd.Series) -> pd.Series:
+            return values.astype(str).str.lower().str.strip()
+
+        parts = {'title': title}
+        for col in ('doi', 'authors'):
+            if col not in df.columns:
+                parts[col] = empty
+            elif isinstance(df[col].dtype, pd.CategoricalDtype):
+                parts[col] = _map_categories(df[col], normalize).cat.codes
+            else:
+                parts[col] = normalize(df[col])
+
+        return pd.DataFrame(parts, index=df.index)
+
+    def _duplicate_key_hashes(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Hash uint64 por registro de las partes de _duplicate_key_frame().
+        
+        pd.util.hash_pandas_object combina las tres columnas en C; registros
+        con la misma clave "titulo|doi|autores" tienen el mismo hash (la
+        probabilidad de colisión entre claves distintas es despreciable).
+        """
+        keys = self._duplicate_key_frame(df)
+        return pd.util.hash_pandas_object(keys, index=False).to_numpy()
+
+    def _duplicate_key_codes(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Código entero de grupo por registro según _duplicate_key_frame().
+        
+        A diferencia de _duplicate_key_hashes(), agrupa por los valores
+        exactos de las tres partes (tabla hash de pandas en C), así que dos
+        claves distintas nunca comparten código. Los códigos se numeran en
+        orden de primera aparición (0, 1, 2...).
+        """
+        keys = self._duplicate_key_frame(df)
+        return keys.groupby(list(keys.columns), sort=False, dropna=False).ngroup().to_numpy()
+
     def identify_duplicates(self, df: Optional[pd.DataFrame] = None) -> Dict[str, List[int]]:
         """
         Identifica grupos de registros duplicados en el DataFrame.
         
-        Itera sobre todos los registros del DataFrame, genera una clave hash
-        para cada uno y agrupa registros con la misma clave. Retorna solo
-        los grupos que tienen más de un registro (duplicados reales).
+        Genera de forma vectorizada la clave de duplicado de todos los
+        registros y agrupa los que comparten clave exacta. Retorna
+        solo los grupos que tienen más de un registro (duplicados reales).
         
         Args:
             df (Optional[pd.DataFrame], optional): DataFrame a analizar.
@@ -412,8 +841,9 @@ class DataCleaner:
         
         Returns:
             Dict[str, List[int]]: Diccionario donde:
-                - Key: Hash MD5 que identifica el grupo de duplicados
-                - Value: Lista de índices de registros que comparten ese hash
+                - Key: Clave "titulo|doi|autores" que identifica el grupo
+                  (la misma que create_duplicate_key())
+                - Value: Lista de índices de registros que comparten esa clave
                 Solo incluye grupos con 2+ registros (duplicados reales).
         
         Raises:
@@ -421,15 +851,18 @@ class DataCleaner:
                 self.df_original is None)
         
         Algorithm:
-            1. Para cada fila en el DataFrame:
-                a. Generar clave hash usando create_duplicate_key()
-                b. Agregar índice a la lista del hash correspondiente
-            2. Filtrar solo grupos con len(lista) > 1
-            3. Calcular estadísticas (total de duplicados a eliminar)
+            1. Construir las partes de la clave "titulo|doi|autores" de todas
+               las filas con operaciones de columna (_duplicate_key_frame)
+            2. pd.util.hash_pandas_object resume las tres partes de cada
+               registro en un hash de 64 bits (una llamada vectorizada)
+            3. Quedarse con los hashes repetidos y agrupar sus índices en
+               orden de primera aparición
+            4. Calcular estadísticas (total de duplicados a eliminar)
         
         Performance:
-            - Tiempo: O(n) donde n = número de registros
-            - Espacio: O(d) donde d = número de duplicados
+            - Tiempo: O(n) donde n = número de registros, sin crear una
+              Series por fila como iterrows()
+            - Espacio: O(n) para las claves y los grupos
             - Muy eficiente incluso con millones de registros
         
         Example:
@@ -463,7 +896,7 @@ class DataCleaner:
             Este método solo IDENTIFICA duplicados, no los elimina.
             La eliminación se hace en clean_data().
         """
-        print("🔍 Identificando duplicados...")
+        logger.info("identificando duplicados")
         
         # Determinar qué DataFrame usar
         if df is None:
@@ -471,46 +904,46 @@ class DataCleaner:
         if df is None:
             raise ValueError("No hay DataFrame cargado para detección de duplicados.")
 
-        # Diccionario para agrupar índices por hash
-        duplicate_groups: Dict[str, List[int]] = {}
-
-        # Iterar sobre cada fila del DataFrame
-        for idx, row in df.iterrows():  # type: ignore[union-attr]
-            # Generar clave hash para esta fila
-            key: str = self.create_duplicate_key(row)
-            
-            # Inicializar lista para este hash si no existe
-            if key not in duplicate_groups:
-                duplicate_groups[key] = []
-            
-            # Agregar índice a la lista de este hash
-            duplicate_groups[key].append(idx)  # type: ignore[arg-type]
+        # Grupo de (titulo, doi, autores) por registro, en C
+        codes = self._duplicate_key_codes(df)
+        if not _has_repeated_codes(codes):
+            logger.info("grupos=0 duplicados=0")
+            return {}
 
         # Filtrar solo grupos con duplicados (más de 1 registro)
-        duplicates = {k: v for k, v in duplicate_groups.items() if len(v) > 1}
+        dup_positions = pd.Series(codes).duplicated(keep=False).to_numpy().nonzero()[0]
+        grouped = pd.Series(df.index[dup_positions]).groupby(codes[dup_positions], sort=False)
 
-        # Mostrar estadísticas
-        print(f"Encontrados {len(duplicates)} grupos de duplicados")
+        # Clave "titulo|doi|autores" de create_duplicate_key() → índices
+        duplicates: Dict[str, List[int]] = {
+            self.create_duplicate_key(df.loc[labels.iat[0]]): labels.tolist()
+            for _, labels in grouped
+        }
 
         # Calcular total de registros que serán eliminados
         # De cada grupo, se elimina len(grupo) - 1 registros
         total_duplicates = sum(len(group) - 1 for group in duplicates.values())
-        print(f"Total de registros duplicados a eliminar: {total_duplicates}")
+        logger.info("grupos=%d duplicados=%d", len(duplicates), total_duplicates)
 
         return duplicates
     
-    def clean_data(self) -> pd.DataFrame:
+    def clean_data(self, verbose: bool = True) -> pd.DataFrame:
         """
         Ejecuta el pipeline completo de limpieza de datos.
         
         Este es el método principal que orquesta todo el proceso de limpieza:
         1. Limpia texto en columnas principales
         2. Elimina registros con títulos vacíos
-        3. Identifica duplicados usando hashing
+        3. Identifica duplicados agrupando por clave normalizada
         4. Elimina duplicados manteniendo primer registro de cada grupo
         5. Resetea índices del DataFrame
         6. Calcula y almacena estadísticas
         
+        Args:
+            verbose (bool, optional): Si False, no imprime los mensajes de
+                inicio y resumen (el progreso por paso va al logger del
+                módulo). Por defecto True.
+        
         Returns:
             pd.DataFrame: DataFrame limpio sin duplicados ni registros inválidos.
                 También se almacena en self.df_clean para acceso posterior.
@@ -523,7 +956,8 @@ class DataCleaner:
             - Modifica self.df_clean (lo crea/actualiza)
             - Modifica self.duplicate_info (guarda metadata de eliminados)
             - Modifica self.cleaning_stats (actualiza contadores)
-            - Imprime mensajes de progreso en consola
+            - Imprime mensajes de inicio y resumen en consola (salvo
+              verbose=False)
         
         Process Flow:
             PASO 1: Limpiar Texto
@@ -535,18 +969,17 @@ class DataCleaner:
             └─ Actualizar cleaning_stats['empty_titles_removed']
             
             PASO 3: Identificar Duplicados
-            ├─ Llamar identify_duplicates() con DataFrame filtrado
-            └─ Obtener grupos de índices duplicados
+            ├─ Construir la clave de duplicado de cada registro (vectorizado)
+            └─ Marcar con Series.duplicated(keep='first') los repetidos
             
             PASO 4: Preparar Eliminación de Duplicados
-            ├─ Para cada grupo de duplicados:
-            │  ├─ Mantener primer índice (menor)
-            │  ├─ Marcar resto para eliminación
+            ├─ Para cada registro repetido:
+            │  ├─ Índice conservado: primer registro con su misma clave
             │  └─ Guardar metadata en duplicate_info
-            └─ Crear lista completa de índices a eliminar
+            └─ La máscara de duplicados define qué filas se eliminan
             
             PASO 5: Eliminar y Resetear
-            ├─ Eliminar filas usando df.drop()
+            ├─ Filtrar filas con la máscara de duplicados
             ├─ Resetear índices (reset_index)
             └─ Actualizar cleaning_stats
         
@@ -578,7 +1011,8 @@ class DataCleaner:
             representativo mantenido.
         
         Metadata Tracking:
-            Para cada registro eliminado, se guarda en duplicate_info:
+            Para cada registro eliminado, se guarda una fila en duplicate_info
+            (índice = registro eliminado):
             - reason: 'DUPLICADO'
             - kept_index: Índice del registro que se mantuvo
             - duplicate_of_title: Primeros 100 chars del título mantenido
@@ -592,93 +1026,337 @@ class DataCleaner:
         
         Note:
             Este método NO modifica df_original. Trabaja en una copia
-            y genera un nuevo DataFrame limpio.
+            superficial (sin duplicar los datos en memoria) y genera un
+            nuevo DataFrame limpio. Con cache_dir, una segunda
+            ejecución sobre el mismo archivo recupera df_clean,
+            duplicate_info y cleaning_stats sin repetir los pasos.
         """
-        print("Iniciando limpieza de datos...")
+        if verbose:
+            print("Iniciando limpieza de datos...")
         
         # Verificar que los datos están cargados
         if self.df_original is None:
             raise ValueError("Datos no cargados. Ejecuta load_data() primero.")
         
+        # Mismo archivo de entrada ya limpiado: recuperar el resultado
+        cache_key = self._input_cache_key() if self.cache_dir and pa is not None else None
+        if cache_key is not None and self._load_cached_clean(cache_key):
+            logger.info("resultado recuperado de caché: %d registros", self.cleaning_stats['clean_count'])
+            assert self.df_clean is not None
+            return self.df_clean
+        
         # ===== PASO 1: CREAR COPIA DE TRABAJO =====
-        df_work: pd.DataFrame = self.df_original.copy()
+        # Copia superficial: comparte los arrays de df_original. Los pasos
+        # siguientes solo reemplazan columnas enteras o filtran filas (nunca
+        # escriben dentro de un array), así que df_original no cambia
+        df_work: pd.DataFrame = self.df_original.copy(deep=False)
         
         # ===== PASO 2: LIMPIAR TEXTO EN COLUMNAS PRINCIPALES =====
-        text_columns = ['title', 'abstract', 'authors', 'journal', 'subjects']
-        for col in text_columns:
-            if col in df_work.columns:
-                # Aplicar clean_text a cada celda de la columna
-                df_work[col] = df_work[col].apply(self.clean_text)
+        # Cada columna completa (equivalente a apply(clean_text)), en paralelo
+        self._clean_text_columns(df_work)
         
         # ===== PASO 3: ELIMINAR REGISTROS CON TÍTULOS VACÍOS =====
-        initial_count = len(df_work)
-        
-        # Filtrar registros donde el título no está vacío después de strip()
-        df_work = df_work.loc[df_work['title'].str.strip() != '']  # type: ignore[assignment]
+        # El PASO 2 ya dejó los títulos sin espacios en los extremos: basta
+        # comparar con '' sobre el array, sin otra pasada de .str.strip()
+        # Las filas se marcan por posición y se seleccionan de una sola vez
+        # en el PASO 6; mientras tanto solo se recorta la tabla de claves
+        non_empty = df_work['title'].to_numpy() != ''
+        candidates = non_empty.nonzero()[0]
+        # La máscara va por posición de df_original
+        self._empty_title_mask = ~non_empty
         
         # Calcular cuántos se eliminaron
-        empty_titles_removed = initial_count - len(df_work)
+        empty_titles_removed = int(non_empty.size - non_empty.sum())
         self.cleaning_stats['empty_titles_removed'] = empty_titles_removed
         
-        if empty_titles_removed > 0:
-            print(f"Eliminados {empty_titles_removed} registros con títulos vacíos")
+        logger.info("títulos vacíos eliminados=%d", empty_titles_removed)
         
         # ===== PASO 4: IDENTIFICAR DUPLICADOS =====
-        duplicates = self.identify_duplicates(df_work)
-        
-        # Listas para almacenar información de eliminación
-        indices_to_remove = []
-        duplicate_info = {}
-        
-        # ===== PASO 5: PREPARAR ELIMINACIÓN DE DUPLICADOS =====
-        for dup_key, indices in duplicates.items():
-            if len(indices) > 1:
-                # Estrategia: mantener el PRIMERO, eliminar el resto
-                keep_idx = indices[0]           # Índice a mantener (primer registro)
-                remove_indices = indices[1:]    # Índices a eliminar (resto)
-                
-                # Para cada índice a eliminar, guardar metadata
-                for remove_idx in remove_indices:
-                    indices_to_remove.append(remove_idx)
-                    
-                    # Obtener título del registro que se mantiene
-                    kept_title_val = df_work.loc[keep_idx, 'title'] if 'title' in df_work.columns else ''
-                    kept_title_str = '' if pd.isna(kept_title_val) else str(kept_title_val)
-                    
-                    # Truncar título a 100 caracteres para metadata
-                    short_kept_title = kept_title_str[:100] + ("..." if len(kept_title_str) > 100 else "")
-                    
-                    # Guardar información del duplicado eliminado
-                    duplicate_info[remove_idx] = {
-                        'reason': 'DUPLICADO',
-                        'kept_index': keep_idx,
-                        'duplicate_of_title': short_kept_title
-                    }
-        
-        # ===== PASO 6: ELIMINAR DUPLICADOS DEL DATAFRAME =====
-        df_work = df_work.drop(indices_to_remove, errors='ignore')
-        self.cleaning_stats['duplicates_removed'] = len(indices_to_remove)
+        # Misma clave que identify_duplicates(), pero la marca de duplicado y
+        # el índice conservado salen de operaciones de columna (tabla hash de
+        # pandas), sin construir listas de índices por grupo
+        logger.info("identificando duplicados")
+        key_columns = [col for col in ('title', 'doi', 'authors') if col in df_work.columns]
+        codes = self._duplicate_key_codes(df_work[key_columns].iloc[candidates])
+        candidate_index = df_work.index[candidates]
+        if _has_repeated_codes(codes):
+            dup_mask = pd.Series(codes).duplicated(keep='first').to_numpy()
+            # Índice conservado de cada registro: el primero con su misma clave
+            kept_index = pd.Series(candidate_index).groupby(codes).transform('first').to_numpy()
+        else:
+            # Todas las claves distintas: nada que agrupar
+            dup_mask = np.zeros(codes.size, dtype=bool)
+            kept_index = candidate_index.to_numpy()
+
+        n_groups = pd.unique(codes[dup_mask]).size
+        logger.info("grupos=%d duplicados=%d", n_groups, int(dup_mask.sum()))
+        
+        # ===== PASO 5: PREPARAR METADATA DE DUPLICADOS =====
+        # Estrategia: mantener el PRIMERO de cada grupo, eliminar el resto.
+        # Orden de duplicate_info: por grupo (primera aparición) y dentro de
+        # cada grupo por posición, como al recorrer los grupos uno a uno
+        removed = pd.DataFrame(
+            {'code': codes[dup_mask], 'kept': kept_index[dup_mask]},
+            index=candidate_index[dup_mask],
+        ).sort_values('code', kind='stable')
+
+        # Título del registro que se mantiene (uno por eliminado, tomados de
+        # una vez por índice), truncado a 100 caracteres
+        titles = df_work['title'].loc[removed['kept']]
+        titles = titles.where(titles.notna(), '').astype(str)
+        kept_titles = titles.str.slice(0, 100).where(
+            titles.str.len() <= 100, titles.str.slice(0, 100) + "..."
+        ).to_numpy()
+
+        duplicate_info = _duplicate_info_frame(removed.index, removed['kept'].to_numpy(), kept_titles)
+        
+        # ===== PASO 6: ELIMINAR VACÍOS Y DUPLICADOS DEL DATAFRAME =====
+        # Una única selección posicional de las filas que quedan
+        df_work = df_work.iloc[candidates[~dup_mask]]
+        self.cleaning_stats['duplicates_removed'] = len(duplicate_info)
         
         # ===== PASO 7: RESETEAR ÍNDICES =====
-        # Después de eliminar filas, los índices quedan discontinuos
-        # reset_index los hace continuos desde 0
-        df_work = df_work.reset_index(drop=True)
+        # Después de eliminar filas, los índices quedan discontinuos. iloc
+        # ya devolvió un DataFrame propio: basta asignar un índice 0..N-1
+        # (reset_index copiaría de nuevo todas las columnas)
+        df_work.index = pd.RangeIndex(len(df_work))
         
         # ===== PASO 8: GUARDAR INFORMACIÓN Y ESTADÍSTICAS =====
         self.duplicate_info = duplicate_info
+        self._df_with_info = None
         self.cleaning_stats['clean_count'] = len(df_work)
         
         # Mostrar resumen de limpieza
-        print("Limpieza completada:")
-        print(f"   Registros originales: {self.cleaning_stats['original_count']:,}")
-        print(f"   Títulos vacíos eliminados: {self.cleaning_stats['empty_titles_removed']:,}")
-        print(f"   Duplicados eliminados: {self.cleaning_stats['duplicates_removed']:,}")
-        print(f"   Registros finales: {self.cleaning_stats['clean_count']:,}")
+        stats = self.cleaning_stats
+        if verbose:
+            print(
+                "Limpieza completada:\n"
+                f"   Registros originales: {stats['original_count']:,}\n"
+                f"   Títulos vacíos eliminados: {stats['empty_titles_removed']:,}\n"
+                f"   Duplicados eliminados: {stats['duplicates_removed']:,}\n"
+                f"   Registros finales: {stats['clean_count']:,}"
+            )
 
         # Guardar DataFrame limpio en la instancia
         self.df_clean = df_work
+        if cache_key is not None:
+            self._store_cached_clean(cache_key)
         return df_work
     
+    def _input_cache_key(self) -> str:
+        """
+        Clave de caché: hash BLAKE2b del contenido de input_file y de la
+        versión de los criterios de limpieza (_CACHE_VERSION).
+        """
+        digest = hashlib.blake2b(f"v{_CACHE_VERSION}".encode(), digest_size=16)
+        with open(self.input_file, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):
+                # Python 3.11+: lectura en un buffer reutilizado, sin un
+                # bytes nuevo por bloque
+                return hashlib.file_digest(f, lambda: digest).hexdigest()
+            for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _cache_paths(self, key: str) -> Tuple[str, str]:
+        """Rutas (Parquet con df_clean, JSON con metadata) de una entrada."""
+        base = os.path.join(self.cache_dir or '', key)
+        return f"{base}.parquet", f"{base}.json"
+
+    def _load_cached_clean(self, key: str) -> bool:
+        """
+        Carga df_clean, duplicate_info y cleaning_stats desde la caché.
+        
+        Returns:
+            bool: True si la entrada existía y se pudo leer.
+        """
+        data_path, meta_path = self._cache_paths(key)
+        if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+            return False
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            df_clean = pd.read_parquet(data_path)
+        except Exception as e:
+            logger.warning("caché de limpieza ilegible, se recalcula: %s", e)
+            return False
+
+        info = meta['duplicate_info']
+        self._df_with_info = None
+        self._empty_title_mask = None
+        self.duplicate_info = _duplicate_info_frame(
+            info['removed_index'], info['kept_index'], info['duplicate_of_title']
+        )
+        self.cleaning_stats.update(meta['cleaning_stats'])
+        self.df_clean = df_clean
+        return True
+
+    def _store_cached_clean(self, key: str) -> None:
+        """
+        Guarda el resultado de clean_data() en la caché.
+        
+        Escribe primero en archivos temporales y los renombra, para que una
+        ejecución interrumpida no deje una entrada a medias.
+        """
+        assert self.df_clean is not None and self.cache_dir
+        data_path, meta_path = self._cache_paths(key)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            _write_parquet(self.df_clean, data_path + '.tmp', compression='zstd')
+            with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump({
+                    'duplicate_info': self.duplicate_info.reset_index()
+                        .drop(columns='reason').to_dict('list'),
+                    'cleaning_stats': self.cleaning_stats,
+                }, f, ensure_ascii=False, default=int)
+            os.replace(data_path + '.tmp', data_path)
+            os.replace(meta_path + '.tmp', meta_path)
+        except Exception as e:
+            logger.warning("no se pudo guardar la caché de limpieza: %s", e)
+
+    def clean_data_streaming(
+        self,
+        output_file: Optional[str] = None,
+        chunksize: int = _STREAM_CHUNK_ROWS,
+    ) -> str:
+        """
+        Limpia y deduplica el CSV por bloques, sin cargarlo entero en memoria.
+        
+        Aplica los mismos criterios que clean_data() (limpieza de texto,
+        títulos vacíos, clave "titulo|doi|autores", se conserva el primer
+        registro de cada grupo), pero lee el archivo con
+        read_csv(chunksize=...) y recuerda solo el hash de 64 bits de cada
+        clave ya vista. Cada bloque depurado se añade a la salida en cuanto
+        se procesa.
+        
+        Args:
+            output_file (Optional[str], optional): Archivo de salida. Por
+                defecto "<entrada>_LIMPIO.parquet" (o .csv sin pyarrow).
+            chunksize (int, optional): Filas por bloque. Por defecto 100,000.
+        
+        Returns:
+            str: Ruta del archivo limpio generado.
+        
+        Side Effects:
+            - Actualiza self.cleaning_stats (no popula df_original, df_clean
+              ni duplicate_info)
+        
+        Performance:
+            Memoria O(chunksize + claves distintas) en lugar de
+            O(registros × columnas).
+        
+        Note:
+            Las columnas se leen como texto para que todos los bloques
+            compartan esquema. Para los archivos _COMPLETO y _REPORTE, que
+            necesitan el dataset original, usar load_data() + clean_data().
+            Para volver a tener un DataFrame: pd.read_parquet(ruta).
+        """
+        if output_file is None:
+            base = os.path.splitext(self.input_file)[0]
+            output_file = f"{base}_LIMPIO.{'parquet' if pa is not None else 'csv'}"
+        use_parquet = pa is not None and output_file.endswith('.parquet')
+
+        print("🧹 Iniciando limpieza de datos por bloques...")
+        seen: set = set()
+        original_count = empty_removed = duplicates_removed = clean_count = 0
+        writer = None
+
+        try:
+            reader = pd.read_csv(self.input_file, encoding='utf-8', dtype=str, chunksize=chunksize)
+            for chunk in reader:
+                original_count += len(chunk)
+
+                # Limpieza de texto y títulos vacíos (PASOS 2-3 de clean_data)
+                self._clean_text_columns(chunk)
+                non_empty = chunk['title'].to_numpy() != ''
+                empty_removed += int(non_empty.size - non_empty.sum())
+                chunk = chunk.iloc[non_empty.nonzero()[0]]
+
+                # Duplicados dentro del bloque y contra los bloques anteriores
+                hashes = pd.Series(self._duplicate_key_hashes(chunk))
+                in_seen = np.fromiter(map(seen.__contains__, hashes.tolist()), dtype=bool, count=len(hashes))
+                keep = ~(hashes.duplicated().to_numpy() | in_seen)
+                seen.update(hashes[keep].tolist())
+                duplicates_removed += int((~keep).sum())
+                chunk = chunk.loc[keep]
+                clean_count += len(chunk)
+                logger.info("bloque leídos=%d limpios=%d total=%d", len(keep), len(chunk), original_count)
+
+                # Añadir el bloque a la salida
+                if use_parquet:
+                    if writer is None:
+                        schema = pa.schema([(str(col), pa.string()) for col in chunk.columns])
+                        writer = pa_parquet.ParquetWriter(output_file, schema)
+                    writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+                else:
+                    chunk.to_csv(output_file, mode='w' if writer is None else 'a',
+                                 header=writer is None, index=False, encoding='utf-8')
+                    writer = True
+        finally:
+            if use_parquet and writer is not None:
+                writer.close()
+
+        self.cleaning_stats.update({
+            'original_count': original_count,
+            'empty_titles_removed': empty_removed,
+            'duplicates_removed': duplicates_removed,
+            'clean_count': clean_count,
+        })
+
+        print(
+            "Limpieza completada:\n"
+            f"   Registros originales: {original_count:,}\n"
+            f"   Títulos vacíos eliminados: {empty_removed:,}\n"
+            f"   Duplicados eliminados: {duplicates_removed:,}\n"
+            f"   Registros finales: {clean_count:,}\n"
+            f"Datos limpios guardados: {output_file}"
+        )
+        return output_file
+
+    def _build_removal_info_series(self) -> pd.Series:
+        """
+        Calcula solo la columna removal_info de create_removal_info_column().
+        
+        Returns:
+            pd.Series: Categórica con el mismo índice que df_original, sin
+                copiar ninguna otra columna.
+        """
+        df = self.df_original
+        assert df is not None
+        
+        # La columna se arma en un único array de objetos
+        # ===== PASO 1: MARCAR DUPLICADOS ELIMINADOS =====
+        # Mensaje con razón e índice conservado, unido por índice (left join);
+        # los índices que no están en el DataFrame se ignoran. Todos los
+        # duplicados de un grupo comparten mensaje: se formatea una vez por
+        # par (razón, conservado) y se reparte con los códigos
+        info = self.duplicate_info
+        messages = np.empty(0, dtype=object)
+        codes = np.empty(0, dtype=np.intp)
+        if len(info):
+            codes, pairs = pd.MultiIndex.from_arrays(
+                [info['reason'], info['kept_index']]
+            ).factorize()
+            messages = np.array([_DUPLICATE_MESSAGE % pair for pair in pairs], dtype=object)
+        removal_messages = pd.Series(messages[codes], index=info.index, dtype=object)
+        removal_info = removal_messages.reindex(df.index, fill_value='').to_numpy(dtype=object)
+        
+        # ===== PASO 2: MARCAR TÍTULOS VACÍOS =====
+        # Los mismos registros que clean_data() descartó por título vacío
+        # (NaN o solo espacios tras limpiar el texto). Si el resultado vino
+        # de la caché, la máscara se recalcula con el mismo criterio
+        empty_title_mask = self._empty_title_mask
+        if empty_title_mask is None or len(empty_title_mask) != len(df):
+            empty_title_mask = self._clean_text_series(df['title']).to_numpy() == ''
+        removal_info[empty_title_mask] = 'ELIMINADO - TÍTULO VACÍO'
+        
+        # ===== PASO 3: MARCAR REGISTROS CONSERVADOS =====
+        # Todos los registros que no tienen removal_info son conservados
+        removal_info[removal_info == ''] = 'CONSERVADO'
+        
+        # Pocos valores distintos (estados + un mensaje por grupo): categórica
+        return pd.Series(pd.Categorical(removal_info), index=df.index, name='removal_info')
+
     def create_removal_info_column(self) -> pd.DataFrame:
         """
         Crea versión del DataFrame original con columna de información de eliminación.
@@ -694,8 +1372,9 @@ class DataCleaner:
         - Recuperación manual de registros si es necesario
         
         Returns:
-            pd.DataFrame: Copia del DataFrame original con nueva columna 'removal_info'
-                que contiene una de las siguientes etiquetas:
+            pd.DataFrame: Copia del DataFrame original con nueva columna
+                'removal_info' (dtype 'category') que contiene una de las
+                siguientes etiquetas:
                 - "CONSERVADO": Registro se mantuvo en dataset limpio
                 - "ELIMINADO - TÍTULO VACÍO": Registro sin título válido
                 - "ELIMINADO - DUPLICADO: Duplicado del índice X": Es copia de otro registro
@@ -734,41 +1413,32 @@ class DataCleaner:
             4. **Documentación**: Evidencia de proceso de limpieza
         
         Note:
-            Este método NO modifica self.df_original. Retorna una nueva copia.
+            Este método NO modifica self.df_original. Retorna una copia
+            superficial (comparte las columnas originales y añade
+            removal_info).
             Para guardar esta versión, usar save_files() que automáticamente
             genera el archivo *_COMPLETO.csv con esta información.
+            
+            El resultado se memoiza hasta el siguiente load_data() o
+            clean_data(): llamadas repetidas (p. ej. inspeccionar y luego
+            save_files()) devuelven el mismo DataFrame sin recalcularlo, así
+            que no conviene modificarlo en el sitio.
         """
         # Verificar que df_original existe
         if self.df_original is None:
             raise ValueError("df_original es None. Llama a load_data() antes de create_removal_info_column().")
 
-        # Crear copia del DataFrame original
-        df_with_info = self.df_original.copy()
-        
-        # Inicializar columna removal_info con strings vacíos
-        df_with_info['removal_info'] = ''
-        
-        # ===== PASO 1: MARCAR DUPLICADOS ELIMINADOS =====
-        for idx, info in self.duplicate_info.items():
-            # Verificar que el índice existe en el DataFrame
-            if idx < len(df_with_info):
-                # Crear mensaje descriptivo con razón e índice conservado
-                removal_message = (
-                    f"ELIMINADO - {info['reason']}: "
-                    f"Duplicado del índice {info['kept_index']}"
-                )
-                df_with_info.loc[idx, 'removal_info'] = removal_message
-        
-        # ===== PASO 2: MARCAR TÍTULOS VACÍOS =====
-        # Identificar registros con títulos vacíos (después de strip)
-        empty_title_mask = df_with_info['title'].str.strip() == ''
-        df_with_info.loc[empty_title_mask, 'removal_info'] = 'ELIMINADO - TÍTULO VACÍO'
-        
-        # ===== PASO 3: MARCAR REGISTROS CONSERVADOS =====
-        # Todos los registros que no tienen removal_info son conservados
-        keep_mask = df_with_info['removal_info'] == ''
-        df_with_info.loc[keep_mask, 'removal_info'] = 'CONSERVADO'
+        # Reutilizar el resultado si df_original y duplicate_info no cambiaron
+        key = (id(self.df_original), id(self.duplicate_info))
+        if self._df_with_info is not None and self._df_with_info_key == key:
+            return self._df_with_info
+
+        # Copia superficial: comparte las columnas de df_original y solo
+        # añade removal_info (df_original no se modifica)
+        df_with_info = self.df_original.copy(deep=False)
+        df_with_info['removal_info'] = self._build_removal_info_series()
         
+        self._df_with_info, self._df_with_info_key = df_with_info, key
         return df_with_info
     
     def generate_cleaning_report(self) -> str:
@@ -837,71 +1507,130 @@ class DataCleaner:
             durante clean_data(). Debe ejecutarse clean_data() antes de
             generar el reporte.
         """
+        buf = io.StringIO()
+        self._write_report_lines(buf)
+        return buf.getvalue()
+    
+    def write_report(self, path: str) -> None:
+        """
+        Escribe el reporte de limpieza directamente en un archivo.
+        
+        Mismo contenido que generate_cleaning_report(), pero las líneas se
+        escriben una a una en el archivo sin construir el texto completo
+        en memoria.
+        
+        Args:
+            path (str): Ruta del archivo de reporte (se sobrescribe).
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            self._write_report_lines(f)
+    
+    def _write_report_lines(self, f: IO[str]) -> None:
+        """Escribe las líneas del reporte de limpieza en el handle f."""
+        stats = self.cleaning_stats
+        
         # Calcular totales y porcentajes
-        total_removed = self.cleaning_stats['original_count'] - self.cleaning_stats['clean_count']
+        total_removed = stats['original_count'] - stats['clean_count']
         
         # Calcular porcentajes con protección contra división por cero
-        if self.cleaning_stats['original_count'] > 0:
-            pct_conserved = (self.cleaning_stats['clean_count'] / 
-                           self.cleaning_stats['original_count'] * 100)
-            pct_removed = (total_removed / 
-                         self.cleaning_stats['original_count'] * 100)
+        if stats['original_count'] > 0:
+            pct_conserved = stats['clean_count'] / stats['original_count'] * 100
+            pct_removed = total_removed / stats['original_count'] * 100
         else:
             pct_conserved = 0.0
             pct_removed = 0.0
         
-        # Construir reporte formateado
-        report = f"""
-        === REPORTE DE LIMPIEZA DE DATOS EBSCO ===
-        Fecha: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        Archivo procesado: {self.input_file}
-
-        ESTADÍSTICAS:
-        - Registros originales: {self.cleaning_stats['original_count']:,}
-        - Registros finales (limpios): {self.cleaning_stats['clean_count']:,}
-        - Total eliminados: {total_removed:,}
-
-        DETALLE DE ELIMINACIONES:
-        - Títulos vacíos: {self.cleaning_stats['empty_titles_removed']:,}
-        - Duplicados: {self.cleaning_stats['duplicates_removed']:,}
-
-        TASA DE LIMPIEZA:
-        - Porcentaje conservado: {pct_conserved:.2f}%
-        - Porcentaje eliminado: {pct_removed:.2f}%
-
-        CRITERIOS DE DUPLICACIÓN:
-        - Título normalizado (sin puntuación, minúsculas)
-        - DOI (si está disponible)
-        - Autores
-
-        ========================================
-        """
-        return report
+        write = f.write
+        write("=== REPORTE DE LIMPIEZA DE DATOS EBSCO ===\n")
+        write(f"Fecha: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        write(f"Archivo procesado: {self.input_file}\n\n")
+        
+        write("ESTADÍSTICAS:\n")
+        write(f"- Registros originales: {stats['original_count']:,}\n")
+        write(f"- Registros finales (limpios): {stats['clean_count']:,}\n")
+        write(f"- Total eliminados: {total_removed:,}\n\n")
+        
+        write("DETALLE DE ELIMINACIONES:\n")
+        write(f"- Títulos vacíos: {stats['empty_titles_removed']:,}\n")
+        write(f"- Duplicados: {stats['duplicates_removed']:,}\n\n")
+        
+        write("TASA DE LIMPIEZA:\n")
+        write(f"- Porcentaje conservado: {pct_conserved:.2f}%\n")
+        write(f"- Porcentaje eliminado: {pct_removed:.2f}%\n\n")
+        
+        write("CRITERIOS DE DUPLICACIÓN:\n")
+        write("- Título normalizado (sin puntuación, minúsculas)\n")
+        write("- DOI (si está disponible)\n")
+        write("- Autores\n\n")
+        
+        write("========================================\n")
     
-    def save_files(self, base_filename: Optional[str] = None) -> Tuple[str, str, str]:
+    def save_files(
+        self,
+        base_filename: Optional[Union[str, 'os.PathLike[str]']] = None,
+        engine: str = 'csv',
+        n_jobs: Optional[int] = None,
+        save_full: bool = True,
+        verbose: bool = True,
+        csv_writer: str = 'pandas',
+        partition_full: bool = False,
+    ) -> Tuple[str, Optional[str], str]:
         """
         Guarda los archivos procesados y el reporte de limpieza.
         
-        Genera y guarda tres archivos en el directorio actual:
+        Por defecto genera y guarda tres archivos en el directorio actual:
         1. *_LIMPIO.csv: Dataset limpio sin duplicados
         2. *_COMPLETO.csv: Dataset original con columna 'removal_info'
+           (se omite con save_full=False)
         3. *_REPORTE.txt: Reporte de texto con estadísticas
         
+        Con engine='parquet' _LIMPIO y _COMPLETO se escriben en Parquet en vez
+        de CSV; con engine='csv+parquet' se escriben los CSV y además una
+        copia *_LIMPIO.parquet / *_COMPLETO.parquet (zstd), que conserva los
+        dtypes y se lee mucho más rápido (cuesta una escritura extra de cada
+        dataset).
+        
         Args:
-            base_filename (Optional[str], optional): Nombre base para los archivos.
+            base_filename (Optional[Union[str, os.PathLike]], optional): Nombre
+                base para los archivos (str o pathlib.Path).
                 Si no se proporciona, genera uno automático con timestamp.
                 Ejemplo: "articles_2025" generará:
                 - articles_2025_LIMPIO.csv
                 - articles_2025_COMPLETO.csv
                 - articles_2025_REPORTE.txt
+            engine (str, optional): Formato de _LIMPIO y _COMPLETO: 'csv',
+                'parquet' (Snappy, columnar y con dtypes; mucho más rápido de
+                escribir y leer) o 'csv+parquet' (CSV más copia Parquet zstd).
+                Por defecto 'csv', que es lo que lee ordenamiento.
+            n_jobs (Optional[int], optional): Hilos para escribir los Parquet
+                (ver _write_parquet). Por defecto os.cpu_count().
+            save_full (bool, optional): Si False, no se construye ni se guarda
+                _COMPLETO (create_removal_info_column copia todo df_original).
+                Por defecto True.
+            verbose (bool, optional): Si False, no imprime las rutas
+                guardadas. Por defecto True.
+            csv_writer (str, optional): Writer de los CSV (engine 'csv' o
+                'csv+parquet'):
+                'pandas' (to_csv) o 'pyarrow' (pyarrow.csv.write_csv, mucho
+                más rápido; ver _write_csv para las diferencias de formato).
+                Por defecto 'pandas'.
+            partition_full (bool, optional): Con engine='parquet', escribe
+                _COMPLETO como dataset Parquet particionado por la columna
+                removal_status (CONSERVADO / TITULO_VACIO / DUPLICADO): un
+                directorio por estado, de modo que los filtros por estado
+                solo leen esa partición. Por defecto False.
         
         Returns:
-            Tuple[str, str, str]: Tupla con las rutas de los tres archivos generados:
-                (clean_file, full_file, report_file)
+            Tuple[str, Optional[str], str]: Tupla con las rutas de los archivos
+                generados: (clean_file, full_file, report_file). full_file es
+                None con save_full=False. Con 'csv+parquet' son las rutas CSV.
         
         Raises:
             ValueError: Si clean_data() no se ha ejecutado previamente
-                (self.df_clean is None)
+                (self.df_clean is None), si engine no es 'csv', 'parquet' ni
+                'csv+parquet', si csv_writer no es 'pandas' ni 'pyarrow', si
+                partition_full se usa sin engine='parquet' o si se pide un
+                engine con Parquet o csv_writer='pyarrow' sin pyarrow instalado
         
         Files Generated:
             1. **LIMPIO.csv**: 
@@ -929,15 +1658,23 @@ class DataCleaner:
             >>> 
             >>> # Opción 1: Generar nombres automáticos con timestamp
             >>> clean, full, report = cleaner.save_files()
-            💾 Archivo limpio guardado: ebsco_data_20250115_143045_LIMPIO.csv
-            💾 Archivo completo guardado: ebsco_data_20250115_143045_COMPLETO.csv
-            📋 Reporte guardado: ebsco_data_20250115_143045_REPORTE.txt
+            Archivo limpio guardado: ebsco_data_20250115_143045_LIMPIO.csv
+            Archivo completo guardado: ebsco_data_20250115_143045_COMPLETO.csv
+            Reporte guardado: ebsco_data_20250115_143045_REPORTE.txt
             
             >>> # Opción 2: Especificar nombre base personalizado
             >>> clean, full, report = cleaner.save_files("ml_articles_cleaned")
-            💾 Archivo limpio guardado: ml_articles_cleaned_LIMPIO.csv
-            💾 Archivo completo guardado: ml_articles_cleaned_COMPLETO.csv
-            📋 Reporte guardado: ml_articles_cleaned_REPORTE.txt
+            Archivo limpio guardado: ml_articles_cleaned_LIMPIO.csv
+            Archivo completo guardado: ml_articles_cleaned_COMPLETO.csv
+            Reporte guardado: ml_articles_cleaned_REPORTE.txt
+            
+            >>> # Opción 3: CSV más copias Parquet para lecturas rápidas
+            >>> clean, full, report = cleaner.save_files("ml_articles_cleaned", engine='csv+parquet')
+            Archivo limpio guardado: ml_articles_cleaned_LIMPIO.csv
+            Archivo limpio guardado: ml_articles_cleaned_LIMPIO.parquet
+            Archivo completo guardado: ml_articles_cleaned_COMPLETO.csv
+            Archivo completo guardado: ml_articles_cleaned_COMPLETO.parquet
+            Reporte guardado: ml_articles_cleaned_REPORTE.txt
             
             >>> # Usar rutas retornadas para procesamiento posterior
             >>> import pandas as pd
@@ -970,29 +1707,107 @@ class DataCleaner:
             # Crear timestamp en formato YYYYMMDD_HHMMSS
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             base_filename = f"ebsco_data_{timestamp}"
+        else:
+            # Acepta también pathlib.Path u otro os.PathLike
+            base_filename = os.fspath(base_filename)
+        
+        if engine not in ('csv', 'parquet', 'csv+parquet'):
+            raise ValueError(f"engine debe ser 'csv', 'parquet' o 'csv+parquet', no {engine!r}")
+        if engine != 'csv' and pa is None:
+            raise ValueError(f"engine={engine!r} requiere pyarrow instalado")
+        # 'csv+parquet': archivos principales en CSV y copias Parquet aparte
+        parquet_copies = engine == 'csv+parquet'
+        file_format = 'csv' if parquet_copies else engine
+        if csv_writer not in ('pandas', 'pyarrow'):
+            raise ValueError(f"csv_writer debe ser 'pandas' o 'pyarrow', no {csv_writer!r}")
+        if file_format == 'csv' and csv_writer == 'pyarrow' and pa is None:
+            raise ValueError("csv_writer='pyarrow' requiere pyarrow instalado")
+        if partition_full and engine != 'parquet':
+            raise ValueError("partition_full=True requiere engine='parquet'")
         
         # ===== CONSTRUIR RUTAS DE ARCHIVOS =====
-        clean_file = f"{base_filename}_LIMPIO.csv"
-        full_file = f"{base_filename}_COMPLETO.csv"
+        clean_file = f"{base_filename}_LIMPIO.{file_format}"
+        full_file = f"{base_filename}_COMPLETO.{file_format}"
         report_file = f"{base_filename}_REPORTE.txt"
         
+        # Escrituras pendientes (función, mensaje): se lanzan juntas en hilos
+        # al final para que el SO solape la E/S de los archivos (pyarrow y la
+        # compresión liberan el GIL)
+        writes: List[Tuple[Callable[[], None], str]] = []
+        
         # ===== GUARDAR ARCHIVO LIMPIO =====
-        self.df_clean.to_csv(clean_file, index=False, encoding='utf-8')
-        print(f"Archivo limpio guardado: {clean_file}")
+        if engine == 'parquet':
+            write_clean = partial(_write_parquet, self.df_clean, clean_file, n_jobs=n_jobs)
+        else:
+            write_clean = partial(_write_csv, self.df_clean, clean_file, csv_writer)
+        writes.append((write_clean, f"Archivo limpio guardado: {clean_file}"))
+        
+        # Copia en Parquet para lecturas posteriores (pd.read_parquet)
+        if parquet_copies:
+            parquet_file = f"{base_filename}_LIMPIO.parquet"
+            writes.append((
+                partial(_write_parquet, self.df_clean, parquet_file, compression='zstd', n_jobs=n_jobs),
+                f"Archivo limpio guardado: {parquet_file}",
+            ))
         
         # ===== GUARDAR ARCHIVO COMPLETO CON INFO DE ELIMINACIÓN =====
-        df_with_info = self.create_removal_info_column()
-        df_with_info.to_csv(full_file, index=False, encoding='utf-8')
-        print(f"Archivo completo guardado: {full_file}")
+        # Con engine='parquet' la columna removal_info se puede leer sola:
+        # pd.read_parquet(full_file, columns=['removal_info']); con
+        # partition_full, filtrar por estado solo lee esa partición:
+        # pd.read_parquet(full_file, filters=[('removal_status', '!=', 'CONSERVADO')])
+        if save_full:
+            # Se construye aquí (no en el hilo): actualiza la memoización
+            df_with_info = self.create_removal_info_column()
+            if partition_full:
+                write_full = partial(_write_parquet_dataset, df_with_info, full_file)
+            elif engine == 'parquet':
+                write_full = partial(_write_parquet, df_with_info, full_file, n_jobs=n_jobs)
+            else:
+                write_full = partial(_write_csv, df_with_info, full_file, csv_writer)
+            writes.append((write_full, f"Archivo completo guardado: {full_file}"))
+            
+            # Copia columnar de _COMPLETO, como la de _LIMPIO: removal_info
+            # (categórica) comprime mucho mejor que en el CSV
+            if parquet_copies:
+                full_parquet_file = f"{base_filename}_COMPLETO.parquet"
+                writes.append((
+                    partial(_write_parquet, df_with_info, full_parquet_file, compression='zstd', n_jobs=n_jobs),
+                    f"Archivo completo guardado: {full_parquet_file}",
+                ))
         
         # ===== GUARDAR REPORTE DE TEXTO =====
-        report = self.generate_cleaning_report()
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(report)
-        print(f"Reporte guardado: {report_file}")
+        writes.append((partial(self.write_report, report_file), f"Reporte guardado: {report_file}"))
+        
+        with ThreadPoolExecutor(max_workers=len(writes)) as pool:
+            futures = [pool.submit(write) for write, _ in writes]
+            # result() relanza en este hilo el error de cualquier escritura
+            for future in futures:
+                future.result()
+        
+        # Mensajes acumulados; se imprimen de una sola vez
+        saved = [message for _, message in writes]
+        if verbose:
+            sys.stdout.write("\n".join(saved) + "\n")
         
         # Retornar tupla con las tres rutas
-        return clean_file, full_file, report_file
+        return clean_file, full_file if save_full else None, report_file
+    
+    def release_originals(self) -> None:
+        """
+        Libera df_original, duplicate_info y la copia con removal_info.
+        
+        Tras save_files() solo df_clean y cleaning_stats siguen siendo útiles
+        para etapas posteriores; el resto ocupa del orden de dos veces el
+        dataset. clean_ebsco_data() lo llama antes de retornar. Después de
+        llamarlo, create_removal_info_column() falla y
+        get_duplicate_analysis() devuelve un DataFrame vacío.
+        """
+        self.df_original = None
+        self.duplicate_info = _duplicate_info_frame([], [], [])
+        self._df_with_info = None
+        self._df_with_info_key = None
+        self._empty_title_mask = None
+        gc.collect()
     
     def get_duplicate_analysis(self) -> pd.DataFrame:
         """
@@ -1059,52 +1874,60 @@ class DataCleaner:
             directamente usando los índices.
         """
         # Si no hay duplicados, retornar DataFrame vacío
-        if not self.duplicate_info:
+        if self.duplicate_info.empty:
             return pd.DataFrame()
         
         # Verificar que df_original existe
         if self.df_original is None:
             raise ValueError("df_original es None. No se puede generar análisis de duplicados.")
 
-        # Lista para almacenar datos de análisis
-        analysis_data = []
-        
-        # Iterar sobre cada duplicado eliminado
-        for idx, info in self.duplicate_info.items():
-            # Verificar que el índice existe en df_original
-            if idx < len(self.df_original):  # type: ignore[arg-type]
-                # Obtener fila del registro eliminado
-                row = self.df_original.iloc[idx]  # type: ignore[index]
-                
-                # Extraer y truncar información relevante
-                titulo_eliminado = str(row.get('title', ''))[:100]
-                if len(str(row.get('title', ''))) > 100:
-                    titulo_eliminado += "..."
-                
-                autores_eliminado = str(row.get('authors', ''))[:50]
-                if len(str(row.get('authors', ''))) > 50:
-                    autores_eliminado += "..."
-                
-                # Construir registro para análisis
-                analysis_data.append({
-                    'indice_eliminado': idx,
-                    'indice_conservado': info['kept_index'],
-                    'titulo_eliminado': titulo_eliminado,
-                    'titulo_conservado': info['duplicate_of_title'],
-                    'autores_eliminado': autores_eliminado,
-                    'doi_eliminado': row.get('doi', ''),
-                    'razon': info['reason']
-                })
+        # Solo índices que existen en df_original (búsqueda por hash en el
+        # índice, una vez para todo el array, en vez de comparar posiciones)
+        info = self.duplicate_info
+        info = info[info.index.isin(self.df_original.index)]
+        if info.empty:
+            return pd.DataFrame()
         
-        # Convertir lista a DataFrame
-        return pd.DataFrame(analysis_data)
+        # Filas eliminadas de una sola vez (columna ausente → '')
+        removed_rows = self.df_original.loc[info.index].reindex(
+            columns=['title', 'authors', 'doi'], fill_value=''
+        )
+        
+        def truncate(values: pd.Series, width: int) -> np.ndarray:
+            # str(valor) recortado a width caracteres, con "..." si era más largo
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # Un solo str()/recorte por nivel, no por duplicado
+                return _map_categories(
+                    values, lambda levels: pd.Series(truncate(levels, width))
+                ).to_numpy(dtype=object)
+            text = values.astype(object).astype(str)
+            short = text.str.slice(0, width)
+            return np.where(text.str.len() > width, short + "...", short).astype(object)
+        
+        # Construir el análisis columna a columna, en un solo DataFrame
+        return pd.DataFrame({
+            'indice_eliminado': info.index.to_numpy(),
+            'indice_conservado': info['kept_index'].to_numpy(),
+            'titulo_eliminado': truncate(removed_rows['title'], 100),
+            'titulo_conservado': info['duplicate_of_title'].to_numpy(),
+            'autores_eliminado': truncate(removed_rows['authors'], 50),
+            'doi_eliminado': removed_rows['doi'].to_numpy(dtype=object),
+            'razon': info['reason'].to_numpy(dtype=object),
+        })
 
 
 # ============================================================================
 # FUNCIÓN DE CONVENIENCIA
 # ============================================================================
 
-def clean_ebsco_data(input_file: str, output_base_name: Optional[str] = None) -> Tuple[str, str, str]:
+def clean_ebsco_data(
+    input_file: str,
+    output_base_name: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    save_full: bool = True,
+    verbose: bool = True,
+    csv_writer: str = 'pandas',
+) -> Tuple[str, Optional[str], str]:
     """
     Función de conveniencia para limpiar datos de EBSCO con un solo comando.
     
@@ -1119,10 +1942,24 @@ def clean_ebsco_data(input_file: str, output_base_name: Optional[str] = None) ->
         output_base_name (Optional[str], optional): Nombre base para archivos
             de salida. Si es None, genera nombre automático con timestamp.
             Por defecto None.
+        cache_dir (Optional[str], optional): Directorio de caché de
+            DataCleaner; re-ejecuciones sobre el mismo archivo no repiten la
+            limpieza. Por defecto None (sin caché).
+        save_full (bool, optional): Si False, no genera el archivo _COMPLETO
+            (útil en pipelines automáticos que no lo leen). Por defecto True.
+        verbose (bool, optional): Si False, no imprime mensajes de progreso
+            (tampoco los resúmenes de load_data/clean_data) y sube a WARNING
+            el nivel del logger del módulo mientras dura la llamada, de modo
+            que el progreso por paso solo registra avisos y errores. Los
+            resúmenes van a stdout, así que con verbose=True se ven aunque
+            no se haya configurado logging. Por defecto True.
+        csv_writer (str, optional): Writer de los CSV de salida, 'pandas' o
+            'pyarrow' (ver DataCleaner.save_files). Por defecto 'pandas'.
     
     Returns:
-        Tuple[str, str, str]: Tupla con rutas de los tres archivos generados:
-            (clean_file_path, full_file_path, report_file_path)
+        Tuple[str, Optional[str], str]: Tupla con rutas de los archivos generados:
+            (clean_file_path, full_file_path, report_file_path); full_file_path
+            es None con save_full=False.
     
     Raises:
         FileNotFoundError: Si input_file no existe
@@ -1140,8 +1977,8 @@ def clean_ebsco_data(input_file: str, output_base_name: Optional[str] = None) ->
         >>> # Uso básico - nombres automáticos
         >>> clean, full, report = clean_ebsco_data("articles.csv")
         🚀 Iniciando proceso de limpieza de datos EBSCO...
-        ✅ Datos cargados exitosamente: 5,432 registros
-        🧹 Iniciando limpieza de datos...
+        Datos cargados exitosamente: 5,432 registros
+        Iniciando limpieza de datos...
         ...
         🎉 Proceso de limpieza completado exitosamente!
         📁 Archivos generados:
@@ -1188,32 +2025,52 @@ def clean_ebsco_data(input_file: str, output_base_name: Optional[str] = None) ->
     Note:
         Esta función es ideal para scripts automatizados o uso interactivo
         rápido. Para workflows complejos, considera usar DataCleaner directamente.
+        Los DataFrames intermedios se liberan antes de retornar
+        (release_originals); para seguir inspeccionándolos, usa DataCleaner.
     """
-    print("🚀 Iniciando proceso de limpieza de datos EBSCO...")
+    if verbose:
+        print("🚀 Iniciando proceso de limpieza de datos EBSCO...")
     
     # ===== PASO 1: VERIFICAR EXISTENCIA DEL ARCHIVO =====
     if not os.path.exists(input_file):
         raise FileNotFoundError(f"El archivo {input_file} no existe")
     
     # ===== PASO 2: CREAR INSTANCIA DE DATACLEANER =====
-    cleaner = DataCleaner(input_file)
-    
-    # ===== PASO 3: CARGAR DATOS =====
-    if not cleaner.load_data():
-        raise Exception("Error cargando los datos")
+    cleaner = DataCleaner(input_file, cache_dir=cache_dir)
     
-    # ===== PASO 4: LIMPIAR DATOS =====
-    cleaner.clean_data()
+    # Sin verbose se omiten los resúmenes y se callan los mensajes INFO del
+    # logger de este módulo (stdout y otros loggers no se tocan)
+    previous_level = logger.level
+    if not verbose:
+        logger.setLevel(max(logging.WARNING, logger.getEffectiveLevel()))
+    try:
+        # ===== PASO 3: CARGAR DATOS =====
+        if not cleaner.load_data(verbose=verbose):
+            raise Exception("Error cargando los datos")
+        
+        # ===== PASO 4: LIMPIAR DATOS =====
+        cleaner.clean_data(verbose=verbose)
+    finally:
+        logger.setLevel(previous_level)
     
     # ===== PASO 5: GUARDAR ARCHIVOS =====
-    clean_file, full_file, report_file = cleaner.save_files(output_base_name)
+    clean_file, full_file, report_file = cleaner.save_files(
+        output_base_name, save_full=save_full, verbose=verbose, csv_writer=csv_writer
+    )
+    
+    # El DataCleaner no se devuelve: liberar el dataset original ya
+    cleaner.release_originals()
     
     # ===== PASO 6: MOSTRAR RESUMEN =====
-    print("🎉 Proceso de limpieza completado exitosamente!")
-    print(f"📁 Archivos generados:")
-    print(f"   📄 Datos limpios: {clean_file}")
-    print(f"   📄 Datos completos: {full_file}")
-    print(f"   📄 Reporte: {report_file}")
+    if verbose:
+        full_line = f"   📄 Datos completos: {full_file}\n" if full_file is not None else ""
+        sys.stdout.write(
+            "🎉 Proceso de limpieza completado exitosamente!\n"
+            "📁 Archivos generados:\n"
+            f"   📄 Datos limpios: {clean_file}\n"
+            f"{full_line}"
+            f"   📄 Reporte: {report_file}\n"
+        )
     
     return clean_file, full_file, report_file
 
@@ -1231,6 +2088,9 @@ if __name__ == "__main__":
     2. Clase DataCleaner (control completo)
     """
     
+    # Progreso por paso del logger del módulo en consola
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     # ========== OPCIÓN 1: FUNCIÓN DE CONVENIENCIA ==========
     # Forma más simple - un solo comando
     print("=" * 60)
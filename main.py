@@ -1,4 +1,6 @@
 import argparse
+import logging
+import logging.handlers
 import os
 import sys
 from datetime import datetime
@@ -7,6 +9,20 @@ from basededatos import EBSCOScraper
 from limepza import DataCleaner, clean_ebsco_data
 
 
+def setup_logging(level: int = logging.INFO):
+    """Progreso por batch del scraper agrupado de 50 en 50 líneas por flush."""
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    handler = logging.handlers.MemoryHandler(capacity=50, flushLevel=logging.ERROR, target=stream)
+    logging.basicConfig(level=level, handlers=[handler])
+
+
+def flush_logging():
+    """Vacía el buffer de logging (p. ej. antes del resumen de cada fase)."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
 def run_scraping(query: str, max_results: int | None, batch_size: int, delay: float, output_csv: str, login_mode: str):
     print("=== FASE 1: SCRAPING ===")
     auto_login = False
@@ -14,7 +30,7 @@ def run_scraping(query: str, max_results: int | None, batch_size: int, delay: fl
 
     # 0. Intentar reutilizar cookies si existen (independiente del modo)
     reused = False
-    if scraper.load_cookies() and scraper.test_cookies():
+    if scraper.load_cookies() and (scraper.test_cookies() or scraper.refresh_session()):
         print("✅ Cookies válidas reutilizadas. Saltando login.")
         reused = True
     else:
@@ -47,27 +63,32 @@ def run_scraping(query: str, max_results: int | None, batch_size: int, delay: fl
                 headless = input("¿Modo headless? (s/n): ").strip().lower() == 's'
                 scraper.login_and_get_cookies(email=email, password=password, headless=headless)
 
-    articles = scraper.scrape_all(
+    # Escritura por batches: no se acumulan todos los artículos en memoria
+    scraped_csv = scraper.scrape_all_to_csv(
         query=query,
+        filename=output_csv,
         max_results=max_results,
         batch_size=batch_size,
         delay=delay,
     )
+    flush_logging()
 
-    if not articles:
+    if scraped_csv is None:
         print("❌ No se generó ningún artículo. Abortando limpieza.")
         return None
 
-    scraper.save_to_csv(articles, output_csv)
-    return output_csv
+    return scraped_csv
 
 
-def run_cleaning(input_csv: str, base_name: str | None):
-    print("=== FASE 2: LIMPIEZA ===")
+def run_cleaning(input_csv: str, base_name: str | None, verbose: bool = True):
+    if verbose:
+        print("=== FASE 2: LIMPIEZA ===")
     if not os.path.exists(input_csv):
         print(f"❌ Archivo no encontrado: {input_csv}")
         return None
-    clean_file, full_file, report_file = clean_ebsco_data(input_csv, base_name)
+    clean_file, full_file, report_file = clean_ebsco_data(input_csv, base_name, verbose=verbose)
+    # El progreso por paso queda en el MemoryHandler: volcarlo antes del resumen
+    flush_logging()
     return clean_file, full_file, report_file
 
 
@@ -86,6 +107,7 @@ def build_arg_parser():
     p.add_argument('--input-csv', help='CSV ya existente para limpiar (si se usa --skip-scrape)')
     p.add_argument('--base-name', help='Nombre base para archivos de limpieza')
     p.add_argument('--interactive', action='store_true', help='Activar modo menú interactivo (similar a basededatos.py)')
+    p.add_argument('--quiet', action='store_true', help='Sin mensajes de progreso de la limpieza (solo avisos y errores en el log)')
 
     return p
 
@@ -103,7 +125,7 @@ def interactive_pipeline():
     scraper = EBSCOScraper(auto_login=False)
 
     # Intento inicial de reutilizar cookies
-    if scraper.load_cookies() and scraper.test_cookies():
+    if scraper.load_cookies() and (scraper.test_cookies() or scraper.refresh_session()):
         print("✅ Cookies válidas reutilizadas. Saltando selección de login.")
     else:
         print("⚠️ No se pudieron reutilizar cookies. Selecciona método de login.")
@@ -143,24 +165,24 @@ def interactive_pipeline():
         delay = 0.0
 
     print(f"\n🚀 Iniciando scraping para: '{query}'")
-    articles = scraper.scrape_all(
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    scrape_csv = scraper.scrape_all_to_csv(
         query=query,
+        filename=f"{query.replace(' ', '_')}_articles_{timestamp}.csv",
         max_results=max_results,
         batch_size=batch_size,
         delay=delay,
     )
+    flush_logging()
 
-    if not articles:
+    if scrape_csv is None:
         print("❌ No se obtuvieron artículos. Saliendo.")
         return
 
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    scrape_csv = f"{query.replace(' ', '_')}_articles_{timestamp}.csv"
-    scraper.save_to_csv(articles, scrape_csv)
-
     print("\n=== LIMPIEZA ===")
     base_name = input("Nombre base para archivos limpios (Enter para automático): ").strip() or None
     clean_file, full_file, report_file = clean_ebsco_data(scrape_csv, base_name)
+    flush_logging()
 
     print("\n=== RESUMEN ===")
     print(f"📄 CSV scraping: {scrape_csv}")
@@ -173,6 +195,7 @@ def interactive_pipeline():
 def main():
     parser = build_arg_parser()
     args = parser.parse_args()
+    setup_logging(logging.WARNING if args.quiet else logging.INFO)
 
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     output_csv = args.output_csv or f"scrape_{timestamp}.csv"
@@ -220,7 +243,7 @@ def main():
         input_csv = args.input_csv
 
     # 2. Limpieza
-    cleaning_result = run_cleaning(input_csv, args.base_name)
+    cleaning_result = run_cleaning(input_csv, args.base_name, verbose=not args.quiet)
     if cleaning_result is None:
         sys.exit(1)
     clean_file, full_file, report_file = cleaning_result